@@ -1,16 +1,30 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.contrib.auth.models import Permission
 from django.utils.translation import gettext_lazy as _
+
+from core.admin import ChangeListQuerysetMixin
 from .models import User
 
 
 @admin.register(User)
-class UserAdmin(BaseUserAdmin):
+class UserAdmin(ChangeListQuerysetMixin, BaseUserAdmin):
     """Custom admin for User model"""
     
     # Fields to display in user list
     list_display = ['email', 'name', 'company', 'is_verified', 'is_staff', 'created_at']
-    list_filter = ['is_staff', 'is_superuser', 'is_active', 'is_verified', 'created_at']
+    # Columns loaded for the list (skips password hash, login dates, etc.)
+    list_only = ('email', 'name', 'company', 'is_verified', 'is_staff', 'created_at')
+    list_filter = [
+        'is_staff',
+        'is_superuser',
+        'is_active',
+        'is_verified',
+        # Range filter (created_at >= start AND < end), served by user_created_desc_idx
+        ('created_at', admin.DateFieldListFilter),
+    ]
+    # Facet counts would add one COUNT per filter option on every page
+    show_facets = admin.ShowFacets.NEVER
     search_fields = ['email', 'name', 'company', 'phone']
     ordering = ['-created_at']
     
@@ -33,5 +47,26 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
     
-    # Use email for authentication
-    filter_horizontal = ('groups', 'user_permissions',)
\ No newline at end of file
+    # Searched via AJAX instead of rendering every group/permission
+    autocomplete_fields = ('groups', 'user_permissions',)
+
+
+@admin.register(Permission)
+class PermissionAdmin(admin.ModelAdmin):
+    """Read-only permission list backing the user permissions autocomplete"""
+    
+    list_display = ['name', 'codename', 'content_type']
+    search_fields = ['codename', 'name']
+    
+    def get_queryset(self, request):
+        """Permission.__str__ reads content_type"""
+        return super().get_queryset(request).select_related('content_type')
+    
+    def has_add_permission(self, request):
+        return False
+    
+    def has_change_permission(self, request, obj=None):
+        return False
+    
+    def has_delete_permission(self, request, obj=None):
+        return False
\ No newline at end of file
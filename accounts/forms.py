@@ -1,4 +1,5 @@
 from django import forms
+from django.db import IntegrityError, transaction
 from django.contrib.auth.forms import UserCreationForm, AuthenticationForm
 from django.utils.translation import gettext_lazy as _
 from crispy_forms.helper import FormHelper
@@ -52,6 +53,23 @@ class UserRegistrationForm(UserCreationForm):
         })
     )
     
+    # Crispy forms helper for Bootstrap styling
+    # (built once per class; crispy only reads it when rendering a form)
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Field('email', css_class='mb-3'),
+        Field('name', css_class='mb-3'),
+        Row(
+            Column('company', css_class='mb-3'),
+            Column('phone', css_class='mb-3'),
+            css_class='row'
+        ),
+        Field('password1', css_class='mb-3'),
+        Field('password2', css_class='mb-3'),
+        Submit('submit', 'Create Account', css_class='btn btn-primary btn-lg w-100')
+    )
+    
     class Meta:
         model = User
         fields = ('email', 'name', 'company', 'phone', 'password1', 'password2')
@@ -59,22 +77,6 @@ class UserRegistrationForm(UserCreationForm):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         
-        # Crispy forms helper for Bootstrap styling
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Field('email', css_class='mb-3'),
-            Field('name', css_class='mb-3'),
-            Row(
-                Column('company', css_class='mb-3'),
-                Column('phone', css_class='mb-3'),
-                css_class='row'
-            ),
-            Field('password1', css_class='mb-3'),
-            Field('password2', css_class='mb-3'),
-            Submit('submit', 'Create Account', css_class='btn btn-primary btn-lg w-100')
-        )
-        
         # Customize password field labels and help text
         self.fields['password1'].label = 'Password'
         self.fields['password1'].help_text = 'Must be at least 8 characters'
@@ -82,21 +84,36 @@ class UserRegistrationForm(UserCreationForm):
         self.fields['password2'].help_text = ''
     
     def clean_email(self):
-        """Validate that email is unique"""
-        email = self.cleaned_data.get('email')
-        if User.objects.filter(email=email).exists():
-            raise forms.ValidationError(
-                _('A user with this email already exists.')
-            )
-        return email.lower()  # Store email in lowercase
+        """
+        Normalize email to lowercase.
+        Uniqueness is enforced by the database when saving (see save()).
+        """
+        return self.cleaned_data.get('email').lower()
+    
+    def _get_validation_exclusions(self):
+        """Skip model-level email uniqueness queries; the DB constraint decides"""
+        exclude = super()._get_validation_exclusions()
+        exclude.add('email')
+        return exclude
     
     def save(self, commit=True):
-        """Save user with is_verified=False (will be verified via email later)"""
+        """
+        Save user with is_verified=False (will be verified via email later).
+        Raises ValidationError on the email field if the address is taken.
+        """
         user = super().save(commit=False)
-        user.email = self.cleaned_data['email'].lower()
+        user.email = self.cleaned_data['email']  # lowercased by clean_email
         user.is_verified = False  # User needs to verify email
         if commit:
-            user.save()
+            try:
+                with transaction.atomic():
+                    user.save()
+            except IntegrityError:
+                error = forms.ValidationError(
+                    _('A user with this email already exists.')
+                )
+                self.add_error('email', error)
+                raise error
         return user
 
 
@@ -122,14 +139,11 @@ class UserLoginForm(AuthenticationForm):
         })
     )
     
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        
-        # Crispy forms helper
-        self.helper = FormHelper()
-        self.helper.form_method = 'post'
-        self.helper.layout = Layout(
-            Field('username', css_class='mb-3'),
-            Field('password', css_class='mb-3'),
-            Submit('submit', 'Login', css_class='btn btn-primary btn-lg w-100')
-        )
\ No newline at end of file
+    # Crispy forms helper (shared by all instances)
+    helper = FormHelper()
+    helper.form_method = 'post'
+    helper.layout = Layout(
+        Field('username', css_class='mb-3'),
+        Field('password', css_class='mb-3'),
+        Submit('submit', 'Login', css_class='btn btn-primary btn-lg w-100')
+    )
\ No newline at end of file
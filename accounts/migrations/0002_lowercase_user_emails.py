@@ -0,0 +1,39 @@
+from django.db import migrations
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def lowercase_emails(apps, schema_editor):
+    """Store every email in lowercase before the case-insensitive constraint"""
+    User = apps.get_model('accounts', 'User')
+    
+    # Accounts that only differ by case must be merged by hand: deleting
+    # one of them here would cascade to its properties
+    collisions = list(
+        User.objects.annotate(email_lower=Lower('email'))
+        .values('email_lower')
+        .annotate(total=Count('id'))
+        .filter(total__gt=1)
+        .values_list('email_lower', flat=True)
+    )
+    if collisions:
+        raise RuntimeError(
+            'Resolve duplicate emails (case-insensitive) before migrating: '
+            + ', '.join(sorted(collisions))
+        )
+    
+    users = list(User.objects.only('id', 'email'))
+    for user in users:
+        user.email = user.email.lower()
+    User.objects.bulk_update(users, ['email'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(lowercase_emails, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def populate_first_name(apps, schema_editor):
+    """Fill first_name from name for existing users (see User.save)"""
+    User = apps.get_model('accounts', 'User')
+    users = list(User.objects.only('id', 'name', 'first_name'))
+    for user in users:
+        name = (user.name or '').strip()
+        user.first_name = name.split(' ', 1)[0][:150]
+    User.objects.bulk_update(users, ['first_name'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_user_email_lower_uniq'),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_first_name, migrations.RunPython.noop),
+    ]
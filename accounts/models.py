@@ -1,5 +1,9 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from django.db import models
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.db.models.functions import Lower
 from django.utils.translation import gettext_lazy as _
 
 
@@ -7,16 +11,67 @@ from django.utils.translation import gettext_lazy as _
 class UserManager(BaseUserManager):
     """Custom user manager where email is the unique identifier"""
     
-    def create_user(self, email, password=None, **extra_fields):
-        """Create and save a regular user with the given email and password"""
+    def _build_user(self, email, **extra_fields):
+        """Return an unsaved user with a normalized (lowercase) email"""
         if not email:
             raise ValueError(_('The Email field must be set'))
-        email = self.normalize_email(email)
+        email = self.normalize_email(email).lower()
         user = self.model(email=email, **extra_fields)
+        user.first_name = self.model.first_name_from(user.name)
+        return user
+    
+    def create_user(self, email, password=None, **extra_fields):
+        """Create and save a regular user with the given email and password"""
+        user = self._build_user(email, **extra_fields)
         user.set_password(password)
         user.save(using=self._db)
         return user
     
+    def bulk_create_users(self, rows, batch_size=500):
+        """
+        Create many users with batched INSERTs (invite lists, CSV imports).
+        
+        `rows` are dicts with `email`, `password` and any extra fields.
+        Emails that already exist, or repeat within `rows`, are skipped.
+        Password hashing is the expensive part and runs in a thread pool
+        (hashlib and argon2 release the GIL while hashing).
+        
+        Returns the users that were inserted, re-read from the database so
+        they carry their pk. A user created concurrently with the same
+        email is skipped by the INSERT and not returned.
+        """
+        users = {}
+        passwords = []
+        for row in rows:
+            row = dict(row)
+            password = row.pop('password', None)
+            user = self._build_user(row.pop('email', None), **row)
+            if user.email not in users:
+                users[user.email] = user
+                passwords.append(password)
+        
+        existing = set(self.filter(email__in=users).values_list('email', flat=True))
+        new_users = [
+            (user, password)
+            for user, password in zip(users.values(), passwords)
+            if user.email not in existing
+        ]
+        with ThreadPoolExecutor() as pool:
+            hashes = list(pool.map(make_password, [password for _, password in new_users]))
+        for (user, _), password_hash in zip(new_users, hashes):
+            user.password = password_hash
+        
+        built = [user for user, _ in new_users]
+        self.bulk_create(built, batch_size=batch_size, ignore_conflicts=True)
+        # ignore_conflicts leaves pk unset: read the rows back, and tell ours
+        # from concurrently created ones by the (salted) password hash
+        password_by_email = {user.email: user.password for user in built}
+        return [
+            user
+            for user in self.filter(email__in=password_by_email).order_by('email')
+            if user.password == password_by_email[user.email]
+        ]
+    
     def create_superuser(self, email, password=None, **extra_fields):
         """Create and save a superuser with the given email and password"""
         extra_fields.setdefault('is_staff', True)
@@ -30,6 +85,10 @@ class UserManager(BaseUserManager):
             raise ValueError(_('Superuser must have is_superuser=True.'))
         
         return self.create_user(email, password, **extra_fields)
+    
+    def get_by_natural_key(self, username):
+        """Look up by the stored (lowercase) email so the unique index is used"""
+        return self.get(**{self.model.USERNAME_FIELD: username.lower()})
 
 
 class User(AbstractUser):
@@ -93,6 +152,20 @@ class User(AbstractUser):
         verbose_name = _('user')
         verbose_name_plural = _('users')
         ordering = ['-created_at']
+        indexes = [
+            # Default ordering and the admin's date filter
+            models.Index(fields=['-created_at'], name='user_created_desc_idx'),
+            # Admin "verified" filter on active accounts, newest first
+            models.Index(
+                fields=['is_verified', '-created_at'],
+                name='user_verified_created_idx',
+                condition=models.Q(is_active=True),
+            ),
+        ]
+        constraints = [
+            # Emails are stored lowercase; this guards against mixed-case writes
+            models.UniqueConstraint(Lower('email'), name='user_email_lower_uniq'),
+        ]
     
     def __str__(self):
         return self.email
@@ -103,8 +176,18 @@ class User(AbstractUser):
     
     def get_short_name(self):
         """Return the first name or email if name is not set"""
-        name = str(self.name).strip()
-        if name:
-            first_name = name.split()[0] if ' ' in name else name
-            return first_name
-        return self.email
\ No newline at end of file
+        return self.first_name or self.email
+    
+    @staticmethod
+    def first_name_from(name):
+        """First word of a full name (split stops at the first space)"""
+        name = (name or '').strip()
+        return name.split(' ', 1)[0][:150]
+    
+    def save(self, *args, **kwargs):
+        """Keep first_name (inherited column) in sync with name"""
+        self.first_name = self.first_name_from(self.name)
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'name' in update_fields:
+            kwargs['update_fields'] = {*update_fields, 'first_name'}
+        super().save(*args, **kwargs)
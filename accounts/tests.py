@@ -1,3 +1,88 @@
+from django.contrib.auth import authenticate
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError
 from django.test import TestCase
+from django.urls import reverse
 
-# Create your tests here.
+from .forms import UserRegistrationForm
+from .models import User
+
+
+class UserEmailTests(TestCase):
+    """Emails are stored lowercase and unique regardless of case"""
+
+    def test_create_user_lowercases_email(self):
+        user = User.objects.create_user('Ana.Silva@Example.COM', 'pw', name='Ana Silva')
+        self.assertEqual(user.email, 'ana.silva@example.com')
+
+    def test_email_unique_ignoring_case(self):
+        User.objects.create_user('ana@example.com', 'pw')
+        with self.assertRaises(IntegrityError):
+            # Bypass the manager so the database constraint is what rejects it
+            User.objects.create(email='ANA@example.com', password='!')
+
+    def test_lookup_ignores_case(self):
+        user = User.objects.create_user('ana@example.com', 'pw')
+        self.assertEqual(User.objects.get_by_natural_key('Ana@Example.com'), user)
+        self.assertEqual(authenticate(username='ANA@EXAMPLE.COM', password='pw'), user)
+        self.assertIsNone(authenticate(username='ANA@EXAMPLE.COM', password='wrong'))
+
+
+class BulkCreateUsersTests(TestCase):
+    """bulk_create_users() returns only the users it actually inserted"""
+
+    def test_returns_inserted_users_with_pk(self):
+        User.objects.create_user('ana@example.com', 'pw')
+        created = User.objects.bulk_create_users([
+            {'email': 'Bia@Example.com', 'password': 'pw1', 'name': 'Bia Souza'},
+            {'email': 'ANA@example.com', 'password': 'pw2'},
+            {'email': 'bia@example.com', 'password': 'pw3'},
+            {'email': 'caio@example.com', 'password': 'pw4'},
+        ])
+        self.assertEqual([user.email for user in created], ['bia@example.com', 'caio@example.com'])
+        self.assertTrue(all(user.pk for user in created))
+        self.assertEqual(created[0].first_name, 'Bia')
+        self.assertEqual(User.objects.count(), 3)
+
+    def test_passwords_are_hashed(self):
+        [user] = User.objects.bulk_create_users([{'email': 'dani@example.com', 'password': 'segredo'}])
+        self.assertTrue(user.check_password('segredo'))
+        self.assertEqual(authenticate(username='dani@example.com', password='segredo'), user)
+
+
+class RegistrationTests(TestCase):
+    """A taken email is reported by the failed INSERT, not by a pre-check"""
+
+    def registration_data(self, email):
+        return {
+            'email': email,
+            'name': 'Ana Silva',
+            'password1': 'xK9#vLq2!mZ',
+            'password2': 'xK9#vLq2!mZ',
+        }
+
+    def test_duplicate_email_becomes_form_error(self):
+        User.objects.create_user('ana@example.com', 'pw')
+        form = UserRegistrationForm(self.registration_data('Ana@Example.com'))
+        self.assertTrue(form.is_valid())
+        with self.assertRaises(ValidationError):
+            form.save()
+        self.assertIn('email', form.errors)
+        self.assertEqual(User.objects.count(), 1)
+
+    def test_register_view_rerenders_on_duplicate_email(self):
+        User.objects.create_user('ana@example.com', 'pw')
+        response = self.client.post(
+            reverse('accounts:register'), self.registration_data('ANA@example.com')
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('email', response.context['form'].errors)
+        self.assertNotIn('_auth_user_id', self.client.session)
+
+    def test_register_view_creates_and_logs_in(self):
+        response = self.client.post(
+            reverse('accounts:register'), self.registration_data('Nova@Example.com')
+        )
+        self.assertEqual(response.status_code, 302)
+        user = User.objects.get(email='nova@example.com')
+        self.assertEqual(self.client.session['_auth_user_id'], str(user.pk))
@@ -1,10 +1,32 @@
+from django.conf import settings
 from django.shortcuts import render, redirect
-from django.contrib.auth import login, logout, authenticate
+from django.contrib.auth import login, logout
 from django.contrib.auth.decorators import login_required
 from django.contrib import messages
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext_lazy as _
 from django.views.decorators.http import require_http_methods
 from .forms import UserRegistrationForm, UserLoginForm
 
+# Flash messages, defined once and translated per active language
+MSG_REGISTERED = _('Welcome %(name)s! Your account has been created successfully.')
+MSG_FIX_ERRORS = _('Please correct the errors below.')
+MSG_LOGGED_IN = _('Welcome back, %(name)s!')
+MSG_INVALID_LOGIN = _('Invalid email or password.')
+MSG_LOGGED_OUT = _('You have been logged out. Goodbye, %(name)s!')
+
+
+def _is_logged_in(request):
+    """
+    Authentication check for pages mostly hit by anonymous visitors.
+    Without a session cookie nobody can be logged in, so the lazy
+    request.user is never resolved for them.
+    """
+    return (
+        settings.SESSION_COOKIE_NAME in request.COOKIES
+        and request.user.is_authenticated
+    )
+
 
 @require_http_methods(["GET", "POST"])
 def register_view(request):
@@ -13,32 +35,32 @@ def register_view(request):
     GET: Display registration form
     POST: Process registration and create user
     """
-    if request.user.is_authenticated:
+    if _is_logged_in(request):
         # Already logged in, redirect to home
         return redirect('home')
     
     if request.method == 'POST':
         form = UserRegistrationForm(request.POST)
+        user = None
         if form.is_valid():
-            user = form.save()
-            
+            try:
+                user = form.save()
+            except ValidationError:
+                # Email taken; the error is already attached to the form
+                pass
+        
+        if user is not None:
             # Log the user in automatically after registration
             login(request, user)
             
             # Success message
-            messages.success(
-                request,
-                f'Welcome {user.name}! Your account has been created successfully.'
-            )
+            messages.success(request, MSG_REGISTERED % {'name': user.name})
             
             # Redirect to home page
             return redirect('home')
         else:
             # Form has errors, they will be displayed in the template
-            messages.error(
-                request,
-                'Please correct the errors below.'
-            )
+            messages.error(request, MSG_FIX_ERRORS)
     else:
         form = UserRegistrationForm()
     
@@ -52,35 +74,27 @@ def login_view(request):
     GET: Display login form
     POST: Authenticate and log in user
     """
-    if request.user.is_authenticated:
+    if _is_logged_in(request):
         # Already logged in, redirect to home
         return redirect('home')
     
     if request.method == 'POST':
         form = UserLoginForm(request, data=request.POST)
         if form.is_valid():
-            email = form.cleaned_data.get('username')  # 'username' field contains email
-            password = form.cleaned_data.get('password')
+            # The form already authenticated the user; hashing the
+            # password a second time would double the login cost
+            user = form.get_user()
+            login(request, user)
             
-            # Authenticate user
-            user = authenticate(request, email=email, password=password)
+            # Success message
+            messages.success(request, MSG_LOGGED_IN % {'name': user.name})
             
-            if user is not None:
-                # Login successful
-                login(request, user)
-                
-                # Success message
-                messages.success(request, f'Welcome back, {user.name}!')
-                
-                # Redirect to next page or home
-                next_url = request.GET.get('next', 'home')
-                return redirect(next_url)
-            else:
-                # Authentication failed
-                messages.error(request, 'Invalid email or password.')
+            # Redirect to next page or home
+            next_url = request.GET.get('next', 'home')
+            return redirect(next_url)
         else:
             # Form validation failed
-            messages.error(request, 'Invalid email or password.')
+            messages.error(request, MSG_INVALID_LOGIN)
     else:
         form = UserLoginForm()
     
@@ -95,7 +109,7 @@ def logout_view(request):
     """
     user_name = request.user.name
     logout(request)
-    messages.info(request, f'You have been logged out. Goodbye, {user_name}!')
+    messages.info(request, MSG_LOGGED_OUT % {'name': user_name})
     return redirect('home')
 
 
@@ -1,3 +1,117 @@
+from django.conf import settings
 from django.contrib import admin
+from django.utils.translation import gettext_lazy as _
 
-# Register your models here.
+
+class ChangeListQuerysetMixin:
+    """
+    Narrow the queryset used by admin change-list pages.
+
+    `list_only` restricts the SELECT to the columns the list actually renders.
+    Only read-only (GET/HEAD) change-list requests are narrowed: action POSTs
+    also resolve to the change-list URL, and they and the change form keep
+    the full row, so they never pay one lazy query per deferred field.
+
+    Read-only change-list requests use the ADMIN_READ_DB database alias, so
+    a configured replica serves the list scans and counts. Writes stay on
+    the default database, and the first change-list request after a write
+    (the redirect following an add, save, delete or action) is served from
+    default, so replica lag never shows the pre-save rows.
+    """
+
+    list_only = ()
+    read_after_write_session_key = '_admin_read_after_write'
+
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        if not self.is_changelist_request(request):
+            return qs
+        return self.get_changelist_queryset(request, qs)
+
+    def get_changelist_queryset(self, request, queryset):
+        """Hook for change-list specific optimizations"""
+        if request.method not in ('GET', 'HEAD'):
+            return queryset
+        if self.list_only:
+            queryset = queryset.only(*self.list_only)
+        if not self.pop_write(request):
+            queryset = queryset.using(getattr(settings, 'ADMIN_READ_DB', 'default'))
+        return queryset
+
+    # Any POST to the add/change form, the delete page or the change-list
+    # (actions, list_editable) may write, so it is marked before handling
+    def changeform_view(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            self.mark_write(request)
+        return super().changeform_view(request, *args, **kwargs)
+
+    def delete_view(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            self.mark_write(request)
+        return super().delete_view(request, *args, **kwargs)
+
+    def changelist_view(self, request, *args, **kwargs):
+        if request.method not in ('GET', 'HEAD'):
+            self.mark_write(request)
+        return super().changelist_view(request, *args, **kwargs)
+
+    def mark_write(self, request):
+        """Send the next change-list read of this model to the default database"""
+        session = getattr(request, 'session', None)
+        if session is not None:
+            labels = set(session.get(self.read_after_write_session_key, ()))
+            labels.add(self.opts.label_lower)
+            session[self.read_after_write_session_key] = sorted(labels)
+
+    def pop_write(self, request):
+        """Return True (once) when this model was written in a previous request"""
+        # Memoized on the request: a change-list may build several querysets
+        cache = request.__dict__.setdefault('_admin_read_after_write', {})
+        label = self.opts.label_lower
+        if label not in cache:
+            session = getattr(request, 'session', None)
+            labels = session.get(self.read_after_write_session_key, ()) if session is not None else ()
+            cache[label] = label in labels
+            if cache[label]:
+                session[self.read_after_write_session_key] = [
+                    other for other in labels if other != label
+                ]
+        return cache[label]
+
+    @staticmethod
+    def is_changelist_request(request):
+        """Return True when the request targets an admin change-list page"""
+        match = getattr(request, 'resolver_match', None)
+        return bool(match and (match.url_name or '').endswith('_changelist'))
+
+
+class InputFilter(admin.SimpleListFilter):
+    """
+    List filter rendered as a text box instead of a list of links.
+
+    The default field filter builds its sidebar with SELECT DISTINCT over the
+    whole table; this one never queries for options. Subclasses set `title`,
+    `parameter_name` and implement `queryset()` using `self.value()`.
+    """
+
+    template = 'admin/input_filter.html'
+
+    def lookups(self, request, model_admin):
+        # A single placeholder keeps has_output() true; options are typed in
+        return ((None, None),)
+
+    def get_facet_counts(self, pk_attname, filtered_qs):
+        return {}
+
+    def choices(self, changelist):
+        # Other active parameters are carried over as hidden form inputs
+        yield {
+            'selected': self.value() is None,
+            'query_string': changelist.get_query_string(remove=[self.parameter_name]),
+            'query_parts': [
+                (key, value)
+                for key, value in changelist.params.items()
+                if key != self.parameter_name
+            ],
+            'display': _('All'),
+        }
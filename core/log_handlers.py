@@ -0,0 +1,42 @@
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+
+class QueuedFileHandler(logging.Handler):
+    """
+    File handler whose disk writes happen on a background thread.
+
+    Records are formatted by this handler (its formatter and level apply)
+    and handed to an inner QueueHandler; a QueueListener drains the queue
+    into a plain FileHandler, so the request thread never blocks on file
+    I/O. The queue is flushed when logging shuts down at interpreter exit.
+
+    This is a plain Handler rather than a QueueHandler subclass: from
+    Python 3.12 on, dictConfig treats every QueueHandler subclass as a
+    queue configuration and requires a `handlers` list.
+    """
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False):
+        super().__init__()
+        self.queue_handler = QueueHandler(queue.SimpleQueue())
+        self.file_handler = logging.FileHandler(filename, mode, encoding, delay)
+        self.listener = QueueListener(self.queue_handler.queue, self.file_handler)
+        self.listener.start()
+
+    def setFormatter(self, fmt):
+        # QueueHandler.prepare() formats the record before queueing it
+        super().setFormatter(fmt)
+        self.queue_handler.setFormatter(fmt)
+
+    def emit(self, record):
+        self.queue_handler.emit(record)
+
+    def close(self):
+        # Called by logging.shutdown() at exit: flush the queue to disk once
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.file_handler.close()
+        self.queue_handler.close()
+        super().close()
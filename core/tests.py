@@ -1,3 +1,75 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import reverse
 
-# Create your tests here.
+from accounts.models import User
+from properties.models import Variable
+
+from .views import HOME_CACHE_KEY
+
+
+class ChangeListReadAfterWriteTests(TestCase):
+    """The change-list loaded right after an admin write reads from default"""
+
+    session_key = '_admin_read_after_write'
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_superuser('admin@example.com', 'pw')
+
+    def setUp(self):
+        self.client.force_login(self.admin)
+
+    @override_settings(ADMIN_READ_DB='replica')
+    def test_add_then_changelist_reads_default(self):
+        response = self.client.post(reverse('admin:properties_variable_add'), {
+            'code': 'VAR_TESTE',
+            'name': 'Variável de teste',
+            'data_type': Variable.DataType.QUANTITATIVA,
+            'category': Variable.Category.DIMENSOES,
+            'display_order': 0,
+            'is_active': 'on',
+            'use_in_regression': 'on',
+        })
+        self.assertRedirects(
+            response, reverse('admin:properties_variable_changelist'),
+            fetch_redirect_response=False,
+        )
+        self.assertEqual(self.client.session[self.session_key], ['properties.variable'])
+
+        response = self.client.get(reverse('admin:properties_variable_changelist'))
+        changelist = response.context['cl']
+        self.assertEqual(changelist.queryset.db, 'default')
+        self.assertIn('VAR_TESTE', [variable.code for variable in changelist.result_list])
+        self.assertEqual(self.client.session[self.session_key], [])
+
+
+
+class HomeViewTests(TestCase):
+    """Cookie-less visitors share one server-side copy of the home page"""
+
+    def setUp(self):
+        cache.delete(HOME_CACHE_KEY)
+
+    def assert_not_client_cacheable(self, response):
+        self.assertEqual(
+            sorted(response['Cache-Control'].split(', ')), ['no-cache', 'private']
+        )
+        self.assertFalse(response.has_header('Expires'))
+
+    def test_anonymous_without_cookies_uses_server_cache(self):
+        with self.assertLogs('core.views', 'INFO') as logs:
+            first = self.client.get('/')
+            second = self.client.get('/')
+        self.assertEqual(len(logs.output), 2)
+        self.assertIsNotNone(cache.get(HOME_CACHE_KEY))
+        self.assertEqual(first.content, second.content)
+        self.assert_not_client_cacheable(second)
+
+    def test_request_with_cookies_is_not_cached(self):
+        user = User.objects.create_user('ana@example.com', 'pw', name='Ana Silva')
+        self.client.force_login(user)
+        response = self.client.get('/')
+        self.assertContains(response, 'Ana')
+        self.assertIsNone(cache.get(HOME_CACHE_KEY))
+        self.assert_not_client_cacheable(response)
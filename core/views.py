@@ -1,9 +1,30 @@
+from django.core.cache import cache
+from django.http import HttpResponse
 from django.shortcuts import render
+from django.template.loader import render_to_string
+from django.views.decorators.cache import cache_control
 import logging
 
 logger = logging.getLogger(__name__)
 
+HOME_CACHE_KEY = 'core:home:anonymous'
+HOME_CACHE_TIMEOUT = 60
+
+
+# Browsers must revalidate so a login or logout never shows a stale navbar;
+# only the server keeps a copy
+@cache_control(private=True, no_cache=True)
 def home(request):
     """Home page view"""
     logger.info("Home page accessed by %s", request.user)
-    return render(request, 'base/home.html')
+    if request.COOKIES:
+        # Session, CSRF or messages cookie: the page may be user-specific
+        return render(request, 'base/home.html')
+    # Visitors without cookies all get the same page (anonymous navbar, no
+    # flash messages), so one shared entry serves them all
+    content = cache.get_or_set(
+        HOME_CACHE_KEY,
+        lambda: render_to_string('base/home.html', request=request),
+        HOME_CACHE_TIMEOUT,
+    )
+    return HttpResponse(content)
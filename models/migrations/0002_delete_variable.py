@@ -0,0 +1,16 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:13
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('models', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='Variable',
+        ),
+    ]
@@ -1,20 +1,147 @@
 from django.contrib import admin
+from django.contrib.postgres.search import SearchQuery
+from django.db import connections, transaction
+from django.db.models import Case, CharField, F, Value, When
+from django.db.models.functions import Concat
+from django.utils import timezone
 from django.utils.html import format_html
+from django.utils.safestring import mark_safe
 
-from properties.models import Property
+from core.admin import ChangeListQuerysetMixin, InputFilter
+from properties.models import SEARCH_CONFIG, Property, PropertyAttributeValue
 from properties.models import Variable
+from properties.paginators import EstimatedCountPaginator
+
+# Rows per UPDATE statement in admin bulk actions
+UPDATE_BATCH_SIZE = 5000
+
+
+def update_in_batches(queryset, **values):
+    """
+    Apply `values` to the rows of `queryset` in primary-key batches.
+    
+    The batches run in one transaction, so an action is applied to all
+    selected rows or to none. QuerySet.update() skips auto_now, so
+    updated_at is set explicitly. Returns the number of updated rows.
+    
+    Large selections on PostgreSQL are sent as a single UPDATE with the
+    primary keys bound as one array parameter (see update_by_pk_array).
+    """
+    values.setdefault('updated_at', timezone.now())
+    manager = queryset.model._default_manager
+    updated = 0
+    with transaction.atomic(using=queryset.db):
+        pks = list(queryset.values_list('pk', flat=True))
+        if len(pks) > UPDATE_BATCH_SIZE and connections[queryset.db].vendor == 'postgresql':
+            return update_by_pk_array(queryset.model, queryset.db, pks, values)
+        for start in range(0, len(pks), UPDATE_BATCH_SIZE):
+            batch = pks[start:start + UPDATE_BATCH_SIZE]
+            updated += manager.using(queryset.db).filter(pk__in=batch).update(**values)
+    return updated
+
+
+def update_by_pk_array(model, using, pks, values):
+    """
+    UPDATE ... WHERE pk = ANY(%s) with `pks` bound as a PostgreSQL array.
+    
+    One parameter regardless of the selection size, instead of an IN list
+    with one placeholder per row. `values` maps concrete field names to
+    Python values, converted with each field's get_db_prep_save().
+    """
+    connection = connections[using]
+    quote_name = connection.ops.quote_name
+    opts = model._meta
+    fields = [opts.get_field(name) for name in values]
+    assignments = ', '.join(f'{quote_name(field.column)} = %s' for field in fields)
+    params = [field.get_db_prep_save(values[field.name], connection) for field in fields]
+    sql = (
+        f'UPDATE {quote_name(opts.db_table)} SET {assignments} '
+        f'WHERE {quote_name(opts.pk.column)} = ANY(%s)'
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params + [pks])
+        return cursor.rowcount
+
+
+def _badge(label, background, color='white', padding='3px 8px'):
+    """Static badge markup, built once at import (labels are constants)"""
+    return mark_safe(
+        f'<span style="background-color: {background}; color: {color}; '
+        f'padding: {padding}; border-radius: 3px; font-size: 11px;">{label}</span>'
+    )
+
+
+# Property role badges
+SUBJECT_BADGE = _badge('SUBJECT', '#ffc107', padding='3px 10px')
+COMPARABLE_BADGE = _badge('COMPARABLE', '#28a745', padding='3px 10px')
+DATA_BADGE = _badge('DATA', '#6c757d', padding='3px 10px')
+ROLE_BADGES = {
+    Property.Role.SUBJECT: SUBJECT_BADGE,
+    Property.Role.COMPARABLE: COMPARABLE_BADGE,
+}
+
+
+# Badges do formulário de variáveis, indexados pelo valor booleano
+REQUIRED_BADGES = {
+    True: _badge('OBRIGATÓRIA', '#dc3545'),
+    False: _badge('OPCIONAL', '#6c757d'),
+}
+ACTIVE_BADGES = {
+    True: _badge('ATIVA', '#28a745'),
+    False: _badge('INATIVA', '#ffc107', color='black'),
+}
+
+
+class CityFilter(InputFilter):
+    """Prefix match on city, typed by the user (no DISTINCT scan)"""
+    title = 'city'
+    parameter_name = 'city'
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(city__istartswith=self.value().strip())
+        return queryset
+
+
+class StateFilter(InputFilter):
+    """Prefix match on state, typed by the user (no DISTINCT scan)"""
+    title = 'state'
+    parameter_name = 'state'
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(state__istartswith=self.value().strip())
+        return queryset
+
+
+class PropertyAttributeValueInline(admin.TabularInline):
+    """Variable values of a property, edited on the property form"""
+    model = PropertyAttributeValue
+    fields = ('variable', 'value_num', 'value_text')
+    extra = 0
+    # Variables are searched (VariableAdmin.search_fields), not listed
+    autocomplete_fields = ('variable',)
 
 
 @admin.register(Property)
-class PropertyAdmin(admin.ModelAdmin):
+class PropertyAdmin(ChangeListQuerysetMixin, admin.ModelAdmin):
     """Admin interface for Property model"""
     
+    # Avoid COUNT(*) scans on large tables (estimated total, no second
+    # unfiltered count next to filtered results)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    # Only indexed columns can be sorted from the column headers
+    list_per_page = 25
+    sortable_by = ('name', 'created_at', 'effective_price_per_sqm')
+    
     # List view configuration
     list_display = [
         'name',
         'property_type',
         'get_location',
-        'price_per_sqm',
+        'effective_price_per_sqm',
         'total_area',
         'role_badge',
         'data_quality',
@@ -22,27 +149,48 @@ class PropertyAdmin(admin.ModelAdmin):
         'created_at'
     ]
     
+    # Join the owner in the change-list query and load only the rendered columns
+    list_select_related = ('user',)
+    list_only = (
+        'name',
+        'property_type',
+        'city',  # used by Property.__str__ (action checkbox label)
+        'effective_price_per_sqm',
+        'total_area',
+        'role',
+        'data_quality',
+        'created_at',
+        'user__email',
+        'user__name',
+    )
+    
     list_filter = [
         'property_type',
-        'is_subject',
-        'is_observed',
+        'role',
         'data_quality',
-        'city',
-        'state',
+        CityFilter,
+        StateFilter,
         'created_at'
     ]
     
+    # Searched through Property.search_vector (see get_search_results);
+    # an email address matches the owner instead
     search_fields = [
         'name',
         'street_address',
         'city',
         'neighborhood',
         'description',
-        'user__email',
-        'user__name'
     ]
+    search_help_text = 'Search name, address, city and description, or an owner email.'
+    
+    readonly_fields = ['effective_price_per_sqm', 'created_at', 'updated_at']
     
-    readonly_fields = ['created_at', 'updated_at']
+    # Search users through UserAdmin.search_fields instead of rendering
+    # every user into a <select> on the change form
+    autocomplete_fields = ('user',)
+    
+    inlines = [PropertyAttributeValueInline]
     
     # Fieldsets for detail/edit view
     fieldsets = (
@@ -65,14 +213,14 @@ class PropertyAdmin(admin.ModelAdmin):
                 'price_per_sqm',
                 'total_price',
                 'total_area',
+                'effective_price_per_sqm',
                 'transaction_date'
             ),
             'description': 'Market transaction data (for comparable properties)'
         }),
         ('Valuation Role', {
             'fields': (
-                'is_subject',
-                'is_observed'
+                'role',
             ),
             'description': 'Define how this property is used in valuation models'
         }),
@@ -89,66 +237,76 @@ class PropertyAdmin(admin.ModelAdmin):
     )
     
     # Custom display methods
+    def get_changelist_queryset(self, request, queryset):
+        """Build the location column in SQL (see get_location)"""
+        queryset = super().get_changelist_queryset(request, queryset)
+        return queryset.annotate(
+            location_label=Case(
+                When(neighborhood='', then=F('city')),
+                default=Concat('neighborhood', Value(', '), 'city'),
+                output_field=CharField(),
+            )
+        )
+    
+    @admin.display(description='Location')
     def get_location(self, obj):
         """Display city and neighborhood"""
+        label = getattr(obj, 'location_label', None)
+        if label is not None:
+            return label
         if obj.neighborhood:
             return f"{obj.neighborhood}, {obj.city}"
         return obj.city
-    get_location.short_description = 'Location'
     
+    @admin.display(description='Role')
     def role_badge(self, obj):
         """Display property role with colored badge"""
-        if obj.is_subject:
-            return format_html(
-                '<span style="background-color: #ffc107; color: white; '
-                'padding: 3px 10px; border-radius: 3px; font-size: 11px;">'
-                'SUBJECT</span>'
-            )
-        elif obj.is_observed:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; '
-                'padding: 3px 10px; border-radius: 3px; font-size: 11px;">'
-                'COMPARABLE</span>'
-            )
-        return format_html(
-            '<span style="background-color: #6c757d; color: white; '
-            'padding: 3px 10px; border-radius: 3px; font-size: 11px;">'
-            'DATA</span>'
-        )
-    role_badge.short_description = 'Role'
+        return ROLE_BADGES.get(obj.role, DATA_BADGE)
     
-    # Filters
-    def get_queryset(self, request):
-        """Optimize queryset with select_related"""
-        qs = super().get_queryset(request)
-        return qs.select_related('user')
+    def get_search_results(self, request, queryset, search_term):
+        """Full-text search on the GIN-indexed search_vector column"""
+        search_term = search_term.strip()
+        if not search_term:
+            return queryset, False
+        if '@' in search_term:
+            # Emails are stored lowercased; hits the unique email index
+            return queryset.filter(user__email=search_term.lower()), False
+        query = SearchQuery(search_term, config=SEARCH_CONFIG, search_type='websearch')
+        return queryset.filter(search_vector=query), False
     
     # Actions
     actions = ['mark_as_subject', 'mark_as_comparable', 'mark_high_quality']
     
     def mark_as_subject(self, request, queryset):
         """Mark selected properties as subject properties"""
-        updated = queryset.update(is_subject=True, is_observed=False)
+        updated = update_in_batches(queryset, role=Property.Role.SUBJECT)
         self.message_user(request, f'{updated} properties marked as subject.')
     mark_as_subject.short_description = "Mark as subject property"
     
     def mark_as_comparable(self, request, queryset):
         """Mark selected properties as comparables"""
-        updated = queryset.update(is_subject=False, is_observed=True)
+        updated = update_in_batches(queryset, role=Property.Role.COMPARABLE)
         self.message_user(request, f'{updated} properties marked as comparable.')
     mark_as_comparable.short_description = "Mark as comparable property"
     
     def mark_high_quality(self, request, queryset):
         """Mark selected properties as high quality data"""
-        updated = queryset.update(data_quality='high')
+        updated = update_in_batches(queryset, data_quality=Property.DataQuality.HIGH)
         self.message_user(request, f'{updated} properties marked as high quality.')
     mark_high_quality.short_description = "Mark as high quality data"
 
 
 @admin.register(Variable)
-class VariableAdmin(admin.ModelAdmin):
+class VariableAdmin(ChangeListQuerysetMixin, admin.ModelAdmin):
     """Interface admin para Catálogo de Variáveis"""
     
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    
+    # Ordenação pelos cabeçalhos só em colunas indexadas
+    list_per_page = 50
+    sortable_by = ('display_order', 'name', 'category', 'code')
+    
     # Visualização em lista
     list_display = [
         'name',
@@ -156,12 +314,29 @@ class VariableAdmin(admin.ModelAdmin):
         'data_type',
         'unit',
         'category',
-        'required_badge',
-        'active_badge',
+        'is_required',
+        'is_active',
         'use_in_regression',
         'display_order'
     ]
     
+    # Resolve a variável origem no mesmo SELECT (evita N+1 na listagem)
+    list_select_related = ('parent_variable',)
+    
+    # Colunas carregadas na listagem (description/choices ficam de fora)
+    list_only = (
+        'name',
+        'code',
+        'data_type',
+        'unit',
+        'category',
+        'is_required',
+        'is_active',
+        'use_in_regression',
+        'display_order',
+        'parent_variable',
+    )
+    
     list_filter = [
         'category',
         'data_type',
@@ -176,7 +351,10 @@ class VariableAdmin(admin.ModelAdmin):
         'description'
     ]
     
-    readonly_fields = ['created_at', 'updated_at']
+    readonly_fields = ['status_badges', 'created_at', 'updated_at']
+    
+    # Busca da variável origem via search_fields (sem <select> com todas)
+    autocomplete_fields = ('parent_variable',)
     
     # Organização em fieldsets
     fieldsets = (
@@ -194,8 +372,12 @@ class VariableAdmin(admin.ModelAdmin):
             'fields': ('choices',),
             'description': 'Lista de opções para variáveis do tipo "escolha". Exemplo: ["Baixo", "Médio", "Alto"]'
         }),
+        ('Variável Derivada', {
+            'fields': ('parent_variable', 'transformation_rule'),
+            'classes': ('collapse',)
+        }),
         ('Configurações', {
-            'fields': ('is_required', 'is_active', 'use_in_regression', 'display_order')
+            'fields': ('status_badges', 'is_required', 'is_active', 'use_in_regression', 'display_order')
         }),
         ('Metadados', {
             'fields': ('created_at', 'updated_at'),
@@ -204,53 +386,33 @@ class VariableAdmin(admin.ModelAdmin):
     )
     
     # Métodos de exibição customizados
-    def required_badge(self, obj):
-        """Badge para campo obrigatório"""
-        if obj.is_required:
-            return format_html(
-                '<span style="background-color: #dc3545; color: white; '
-                'padding: 3px 8px; border-radius: 3px; font-size: 11px;">'
-                'OBRIGATÓRIA</span>'
-            )
-        return format_html(
-            '<span style="background-color: #6c757d; color: white; '
-            'padding: 3px 8px; border-radius: 3px; font-size: 11px;">'
-            'OPCIONAL</span>'
-        )
-    required_badge.short_description = 'Obrigatória?'
-    
-    def active_badge(self, obj):
-        """Badge para status ativo"""
-        if obj.is_active:
-            return format_html(
-                '<span style="background-color: #28a745; color: white; '
-                'padding: 3px 8px; border-radius: 3px; font-size: 11px;">'
-                'ATIVA</span>'
-            )
+    # (na listagem, is_required/is_active usam os ícones booleanos do admin)
+    @admin.display(description='Status')
+    def status_badges(self, obj):
+        """Badges de obrigatoriedade e status no formulário"""
         return format_html(
-            '<span style="background-color: #ffc107; color: black; '
-            'padding: 3px 8px; border-radius: 3px; font-size: 11px;">'
-            'INATIVA</span>'
+            '{} {}',
+            REQUIRED_BADGES[bool(obj.is_required)],
+            ACTIVE_BADGES[bool(obj.is_active)],
         )
-    active_badge.short_description = 'Status'
     
     # Ações
     actions = ['activate_variables', 'deactivate_variables', 'mark_as_required']
     
     def activate_variables(self, request, queryset):
         """Ativar variáveis selecionadas"""
-        updated = queryset.update(is_active=True)
+        updated = update_in_batches(queryset, is_active=True)
         self.message_user(request, f'{updated} variável(is) ativada(s).')
     activate_variables.short_description = "Ativar variáveis selecionadas"
     
     def deactivate_variables(self, request, queryset):
         """Desativar variáveis selecionadas"""
-        updated = queryset.update(is_active=False)
+        updated = update_in_batches(queryset, is_active=False)
         self.message_user(request, f'{updated} variável(is) desativada(s).')
     deactivate_variables.short_description = "Desativar variáveis selecionadas"
     
     def mark_as_required(self, request, queryset):
         """Marcar como obrigatórias"""
-        updated = queryset.update(is_required=True)
+        updated = update_in_batches(queryset, is_required=True)
         self.message_user(request, f'{updated} variável(is) marcada(s) como obrigatória(s).')
     mark_as_required.short_description = "Marcar como obrigatórias"
\ No newline at end of file
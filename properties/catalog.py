@@ -0,0 +1,375 @@
+"""
+Catálogo inicial de variáveis (compatível com SisDea).
+
+Usado pelo comando load_variable_catalog (sync_variable_catalog). A migração
+0009_seed_variable_catalog tem uma cópia congelada destas entradas.
+"""
+from types import MappingProxyType
+
+from django.db import transaction
+from django.utils import timezone
+
+# Campos do catálogo sobrescritos quando a variável já existe. Flags de uso
+# (is_required, is_active, ...) só valem na criação: ajustes feitos no admin
+# são preservados. updated_at invalida o cache de regression_vars.
+CATALOG_UPDATE_FIELDS = [
+    'name',
+    'description',
+    'data_type',
+    'unit',
+    'min_value',
+    'max_value',
+    'choices',
+    'choice_order',
+    'category',
+    'updated_at',
+]
+
+# Tabelas de opções (somente leitura), compartilhadas entre as variáveis
+PADRAO_CHOICES = MappingProxyType({
+    'baixo': 'Baixo',
+    'medio': 'Médio',
+    'alto': 'Alto',
+    'luxo': 'Luxo',
+})
+PADRAO_ORDER = ('baixo', 'medio', 'alto', 'luxo')
+
+CONSERVACAO_CHOICES = MappingProxyType({
+    'pessimo': 'Péssimo',
+    'ruim': 'Ruim',
+    'regular': 'Regular',
+    'bom': 'Bom',
+    'otimo': 'Ótimo',
+    'novo': 'Novo/Reformado',
+})
+CONSERVACAO_ORDER = ('pessimo', 'ruim', 'regular', 'bom', 'otimo', 'novo')
+
+LOCALIZACAO_QUALIDADE_CHOICES = MappingProxyType({
+    'ruim': 'Ruim',
+    'regular': 'Regular',
+    'boa': 'Boa',
+    'otima': 'Ótima',
+    'excelente': 'Excelente',
+})
+LOCALIZACAO_QUALIDADE_ORDER = ('ruim', 'regular', 'boa', 'otima', 'excelente')
+
+POSICAO_QUADRA_CHOICES = MappingProxyType({
+    'meio': 'Meio de Quadra',
+    'esquina': 'Esquina',
+    'duas_frentes': 'Duas Frentes',
+    'vila': 'Vila/Encravado',
+})
+
+VISTA_CHOICES = MappingProxyType({
+    'interna': 'Interna/Limitada',
+    'rua': 'Rua',
+    'lateral': 'Lateral',
+    'livre': 'Livre/Ampla',
+    'panoramica': 'Panorâmica',
+    'mar': 'Mar',
+    'montanha': 'Montanha',
+})
+
+ORIENTACAO_SOLAR_CHOICES = MappingProxyType({
+    'norte': 'Norte',
+    'sul': 'Sul',
+    'leste': 'Leste',
+    'oeste': 'Oeste',
+    'nordeste': 'Nordeste',
+    'noroeste': 'Noroeste',
+    'sudeste': 'Sudeste',
+    'sudoeste': 'Sudoeste',
+})
+
+SIM_NAO_CHOICES = MappingProxyType({
+    'nao': 'Não',
+    'sim': 'Sim',
+})
+
+VARIABLES = (
+    # === DIMENSÕES E ÁREAS ===
+    {
+        'code': 'area_total',
+        'name': 'Área Total',
+        'description': 'Área total construída do imóvel em metros quadrados',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 100000,
+        'category': 'dimensoes',
+        'is_required': True,
+    },
+    {
+        'code': 'area_privativa',
+        'name': 'Área Privativa',
+        'description': 'Área privativa do imóvel (excluindo áreas comuns)',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 100000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'area_terreno',
+        'name': 'Área do Terreno',
+        'description': 'Área total do terreno em metros quadrados',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 1000000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'frente',
+        'name': 'Frente',
+        'description': 'Medida da frente do terreno em metros',
+        'data_type': 'quantitativa',
+        'unit': 'm',
+        'min_value': 0,
+        'max_value': 1000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'quartos',
+        'name': 'Quartos',
+        'description': 'Número de quartos/dormitórios',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'suites',
+        'name': 'Suítes',
+        'description': 'Número de suítes',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 10,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'banheiros',
+        'name': 'Banheiros',
+        'description': 'Número de banheiros',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'vagas',
+        'name': 'Vagas de Garagem',
+        'description': 'Número de vagas de garagem',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    
+    # === LOCALIZAÇÃO ===
+    {
+        'code': 'dist_centro',
+        'name': 'Distância ao Centro',
+        'description': 'Distância ao centro da cidade em quilômetros',
+        'data_type': 'quantitativa',
+        'unit': 'km',
+        'min_value': 0,
+        'max_value': 500,
+        'category': 'localizacao',
+    },
+    {
+        'code': 'dist_metro',
+        'name': 'Distância ao Metrô',
+        'description': 'Distância à estação de metrô mais próxima em metros',
+        'data_type': 'quantitativa',
+        'unit': 'm',
+        'min_value': 0,
+        'max_value': 50000,
+        'category': 'localizacao',
+    },
+    
+    # === CARACTERÍSTICAS CONSTRUTIVAS ===
+    {
+        'code': 'idade',
+        'name': 'Idade Aparente',
+        'description': 'Idade aparente do imóvel em anos',
+        'data_type': 'quantitativa',
+        'unit': 'anos',
+        'min_value': 0,
+        'max_value': 200,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'andar',
+        'name': 'Andar',
+        'description': 'Andar do apartamento (0=térreo)',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 100,
+        'category': 'caracteristicas',
+    },
+    
+    # === QUALITATIVAS ORDINAIS ===
+    {
+        'code': 'padrao',
+        'name': 'Padrão Construtivo',
+        'description': 'Padrão de acabamento e construção do imóvel',
+        'data_type': 'qualitativa_ordinal',
+        'choices': PADRAO_CHOICES,
+        'choice_order': PADRAO_ORDER,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'conservacao',
+        'name': 'Estado de Conservação',
+        'description': 'Estado geral de conservação do imóvel',
+        'data_type': 'qualitativa_ordinal',
+        'choices': CONSERVACAO_CHOICES,
+        'choice_order': CONSERVACAO_ORDER,
+        'category': 'conservacao',
+    },
+    {
+        'code': 'localizacao_qualidade',
+        'name': 'Qualidade da Localização',
+        'description': 'Avaliação qualitativa da localização (bairro, infraestrutura)',
+        'data_type': 'qualitativa_ordinal',
+        'choices': LOCALIZACAO_QUALIDADE_CHOICES,
+        'choice_order': LOCALIZACAO_QUALIDADE_ORDER,
+        'category': 'localizacao',
+    },
+    
+    # === QUALITATIVAS NOMINAIS ===
+    {
+        'code': 'posicao_quadra',
+        'name': 'Posição na Quadra',
+        'description': 'Posição do imóvel na quadra',
+        'data_type': 'qualitativa_nominal',
+        'choices': POSICAO_QUADRA_CHOICES,
+        'category': 'localizacao',
+    },
+    {
+        'code': 'vista',
+        'name': 'Vista',
+        'description': 'Tipo de vista do imóvel',
+        'data_type': 'qualitativa_nominal',
+        'choices': VISTA_CHOICES,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'orientacao_solar',
+        'name': 'Orientação Solar',
+        'description': 'Orientação solar predominante',
+        'data_type': 'qualitativa_nominal',
+        'choices': ORIENTACAO_SOLAR_CHOICES,
+        'category': 'caracteristicas',
+    },
+    
+    # === INFRAESTRUTURA (Boolean/Dummy) ===
+    {
+        'code': 'elevador',
+        'name': 'Elevador',
+        'description': 'Presença de elevador no edifício',
+        'data_type': 'qualitativa_nominal',
+        'choices': SIM_NAO_CHOICES,
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'piscina',
+        'name': 'Piscina',
+        'description': 'Presença de piscina (condomínio ou privativa)',
+        'data_type': 'qualitativa_nominal',
+        'choices': SIM_NAO_CHOICES,
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'churrasqueira',
+        'name': 'Churrasqueira',
+        'description': 'Presença de churrasqueira',
+        'data_type': 'qualitativa_nominal',
+        'choices': SIM_NAO_CHOICES,
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'varanda',
+        'name': 'Varanda/Sacada',
+        'description': 'Presença de varanda ou sacada',
+        'data_type': 'qualitativa_nominal',
+        'choices': SIM_NAO_CHOICES,
+        'category': 'caracteristicas',
+    },
+)
+
+
+def _model_kwargs(var_data):
+    """Copia uma entrada do catálogo com as tabelas de opções em tipos JSON"""
+    kwargs = dict(var_data)
+    if 'choices' in kwargs:
+        kwargs['choices'] = dict(kwargs['choices'])
+    if 'choice_order' in kwargs:
+        kwargs['choice_order'] = list(kwargs['choice_order'])
+    return kwargs
+
+
+def build_variables(model):
+    """Instâncias (não salvas) de `model` para todas as entradas do catálogo"""
+    return [model(**_model_kwargs(var_data)) for var_data in VARIABLES]
+
+
+def sync_variable_catalog(model=None):
+    """
+    Grava VARIABLES escrevendo só o que difere do banco.
+    
+    Um SELECT carrega as variáveis do catálogo por code; as ausentes são
+    criadas com bulk_create e só as que diferem em CATALOG_UPDATE_FIELDS
+    são regravadas com bulk_update (com updated_at). Sem diferenças nada
+    é escrito, e os caches ligados a updated_at continuam válidos.
+    
+    `model` permite passar o modelo histórico em um RunPython; por padrão
+    usa properties.models.Variable. Retorna (códigos criados, códigos
+    atualizados).
+    """
+    if model is None:
+        from properties.models import Variable as model
+    
+    compared_fields = [
+        model._meta.get_field(name)
+        for name in CATALOG_UPDATE_FIELDS
+        if name != 'updated_at'
+    ]
+    now = timezone.now()
+    to_create = []
+    to_update = []
+    
+    with transaction.atomic():
+        existing = model.objects.order_by().in_bulk(
+            [var_data['code'] for var_data in VARIABLES], field_name='code'
+        )
+        for variable in build_variables(model):
+            current = existing.get(variable.code)
+            if current is None:
+                to_create.append(variable)
+                continue
+            
+            # to_python normaliza os valores do catálogo (ex.: int -> Decimal)
+            changed = False
+            for field in compared_fields:
+                value = field.to_python(getattr(variable, field.attname))
+                if getattr(current, field.attname) != value:
+                    setattr(current, field.attname, value)
+                    changed = True
+            if changed:
+                current.updated_at = now
+                to_update.append(current)
+        
+        model.objects.bulk_create(to_create)
+        model.objects.bulk_update(to_update, CATALOG_UPDATE_FIELDS)
+    
+    return (
+        [variable.code for variable in to_create],
+        [variable.code for variable in to_update],
+    )
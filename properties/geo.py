@@ -0,0 +1,49 @@
+"""
+Great-circle distances between property coordinates.
+
+Vectorized over numpy arrays (see PropertyQuerySet.as_arrays), so a
+comparable search evaluates every candidate in one pass.
+"""
+import math
+
+import numpy as np
+
+# Mean Earth radius (IUGG)
+EARTH_RADIUS_KM = 6371.0088
+
+# Length of one degree of latitude
+KM_PER_DEGREE = math.pi * EARTH_RADIUS_KM / 180
+
+
+def haversine_km(lat, lon, lat0, lon0):
+    """Distance in km from (lat0, lon0) to each point of the `lat`/`lon` arrays"""
+    lat = np.radians(lat)
+    lon = np.radians(lon)
+    lat0 = math.radians(lat0)
+    lon0 = math.radians(lon0)
+    a = (
+        np.sin((lat - lat0) / 2) ** 2
+        + math.cos(lat0) * np.cos(lat) * np.sin((lon - lon0) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def bounding_box(lat0, lon0, radius_km):
+    """
+    (min_lat, max_lat, min_lon, max_lon) enclosing the circle of
+    `radius_km` around (lat0, lon0).
+    
+    The longitude bounds are None when the box reaches a pole or crosses
+    the antimeridian.
+    """
+    delta_lat = radius_km / KM_PER_DEGREE
+    min_lat = max(lat0 - delta_lat, -90.0)
+    max_lat = min(lat0 + delta_lat, 90.0)
+    if min_lat == -90.0 or max_lat == 90.0:
+        return min_lat, max_lat, None, None
+    delta_lon = delta_lat / math.cos(math.radians(lat0))
+    min_lon = lon0 - delta_lon
+    max_lon = lon0 + delta_lon
+    if min_lon < -180.0 or max_lon > 180.0:
+        return min_lat, max_lat, None, None
+    return min_lat, max_lat, min_lon, max_lon
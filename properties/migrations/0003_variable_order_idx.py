@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0002_variable'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='variable',
+            index=models.Index(fields=['category', 'display_order', 'name'], name='var_order_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:45
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0005_property_search_vector'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('city'), name='text_pattern_ops'), name='prop_city_upper_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('state'), name='text_pattern_ops'), name='prop_state_upper_idx'),
+        ),
+    ]
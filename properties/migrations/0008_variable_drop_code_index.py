@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:49
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0007_property_sortable_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='variable',
+            name='properties__code_0942d3_idx',
+        ),
+    ]
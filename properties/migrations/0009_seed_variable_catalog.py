@@ -0,0 +1,290 @@
+from django.db import migrations
+
+# Catálogo congelado na data desta migração: mudanças posteriores em
+# properties.catalog não alteram o que um banco novo recebe aqui.
+CATALOG = [
+    {
+        'code': 'area_total',
+        'name': 'Área Total',
+        'description': 'Área total construída do imóvel em metros quadrados',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 100000,
+        'category': 'dimensoes',
+        'is_required': True,
+    },
+    {
+        'code': 'area_privativa',
+        'name': 'Área Privativa',
+        'description': 'Área privativa do imóvel (excluindo áreas comuns)',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 100000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'area_terreno',
+        'name': 'Área do Terreno',
+        'description': 'Área total do terreno em metros quadrados',
+        'data_type': 'quantitativa',
+        'unit': 'm²',
+        'min_value': 0,
+        'max_value': 1000000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'frente',
+        'name': 'Frente',
+        'description': 'Medida da frente do terreno em metros',
+        'data_type': 'quantitativa',
+        'unit': 'm',
+        'min_value': 0,
+        'max_value': 1000,
+        'category': 'dimensoes',
+    },
+    {
+        'code': 'quartos',
+        'name': 'Quartos',
+        'description': 'Número de quartos/dormitórios',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'suites',
+        'name': 'Suítes',
+        'description': 'Número de suítes',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 10,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'banheiros',
+        'name': 'Banheiros',
+        'description': 'Número de banheiros',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'vagas',
+        'name': 'Vagas de Garagem',
+        'description': 'Número de vagas de garagem',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 20,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'dist_centro',
+        'name': 'Distância ao Centro',
+        'description': 'Distância ao centro da cidade em quilômetros',
+        'data_type': 'quantitativa',
+        'unit': 'km',
+        'min_value': 0,
+        'max_value': 500,
+        'category': 'localizacao',
+    },
+    {
+        'code': 'dist_metro',
+        'name': 'Distância ao Metrô',
+        'description': 'Distância à estação de metrô mais próxima em metros',
+        'data_type': 'quantitativa',
+        'unit': 'm',
+        'min_value': 0,
+        'max_value': 50000,
+        'category': 'localizacao',
+    },
+    {
+        'code': 'idade',
+        'name': 'Idade Aparente',
+        'description': 'Idade aparente do imóvel em anos',
+        'data_type': 'quantitativa',
+        'unit': 'anos',
+        'min_value': 0,
+        'max_value': 200,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'andar',
+        'name': 'Andar',
+        'description': 'Andar do apartamento (0=térreo)',
+        'data_type': 'quantitativa',
+        'unit': 'unidades',
+        'min_value': 0,
+        'max_value': 100,
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'padrao',
+        'name': 'Padrão Construtivo',
+        'description': 'Padrão de acabamento e construção do imóvel',
+        'data_type': 'qualitativa_ordinal',
+        'choices': {
+            'baixo': 'Baixo',
+            'medio': 'Médio',
+            'alto': 'Alto',
+            'luxo': 'Luxo',
+        },
+        'choice_order': ['baixo', 'medio', 'alto', 'luxo'],
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'conservacao',
+        'name': 'Estado de Conservação',
+        'description': 'Estado geral de conservação do imóvel',
+        'data_type': 'qualitativa_ordinal',
+        'choices': {
+            'pessimo': 'Péssimo',
+            'ruim': 'Ruim',
+            'regular': 'Regular',
+            'bom': 'Bom',
+            'otimo': 'Ótimo',
+            'novo': 'Novo/Reformado',
+        },
+        'choice_order': ['pessimo', 'ruim', 'regular', 'bom', 'otimo', 'novo'],
+        'category': 'conservacao',
+    },
+    {
+        'code': 'localizacao_qualidade',
+        'name': 'Qualidade da Localização',
+        'description': 'Avaliação qualitativa da localização (bairro, infraestrutura)',
+        'data_type': 'qualitativa_ordinal',
+        'choices': {
+            'ruim': 'Ruim',
+            'regular': 'Regular',
+            'boa': 'Boa',
+            'otima': 'Ótima',
+            'excelente': 'Excelente',
+        },
+        'choice_order': ['ruim', 'regular', 'boa', 'otima', 'excelente'],
+        'category': 'localizacao',
+    },
+    {
+        'code': 'posicao_quadra',
+        'name': 'Posição na Quadra',
+        'description': 'Posição do imóvel na quadra',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'meio': 'Meio de Quadra',
+            'esquina': 'Esquina',
+            'duas_frentes': 'Duas Frentes',
+            'vila': 'Vila/Encravado',
+        },
+        'category': 'localizacao',
+    },
+    {
+        'code': 'vista',
+        'name': 'Vista',
+        'description': 'Tipo de vista do imóvel',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'interna': 'Interna/Limitada',
+            'rua': 'Rua',
+            'lateral': 'Lateral',
+            'livre': 'Livre/Ampla',
+            'panoramica': 'Panorâmica',
+            'mar': 'Mar',
+            'montanha': 'Montanha',
+        },
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'orientacao_solar',
+        'name': 'Orientação Solar',
+        'description': 'Orientação solar predominante',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'norte': 'Norte',
+            'sul': 'Sul',
+            'leste': 'Leste',
+            'oeste': 'Oeste',
+            'nordeste': 'Nordeste',
+            'noroeste': 'Noroeste',
+            'sudeste': 'Sudeste',
+            'sudoeste': 'Sudoeste',
+        },
+        'category': 'caracteristicas',
+    },
+    {
+        'code': 'elevador',
+        'name': 'Elevador',
+        'description': 'Presença de elevador no edifício',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'nao': 'Não',
+            'sim': 'Sim',
+        },
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'piscina',
+        'name': 'Piscina',
+        'description': 'Presença de piscina (condomínio ou privativa)',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'nao': 'Não',
+            'sim': 'Sim',
+        },
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'churrasqueira',
+        'name': 'Churrasqueira',
+        'description': 'Presença de churrasqueira',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'nao': 'Não',
+            'sim': 'Sim',
+        },
+        'category': 'infraestrutura',
+    },
+    {
+        'code': 'varanda',
+        'name': 'Varanda/Sacada',
+        'description': 'Presença de varanda ou sacada',
+        'data_type': 'qualitativa_nominal',
+        'choices': {
+            'nao': 'Não',
+            'sim': 'Sim',
+        },
+        'category': 'caracteristicas',
+    },
+]
+
+
+def seed_catalog(apps, schema_editor):
+    """Insere o catálogo SisDea; variáveis já existentes não são alteradas"""
+    Variable = apps.get_model('properties', 'Variable')
+    Variable.objects.using(schema_editor.connection.alias).bulk_create(
+        [Variable(**var_data) for var_data in CATALOG],
+        ignore_conflicts=True,
+        batch_size=500,
+    )
+
+
+def unseed_catalog(apps, schema_editor):
+    Variable = apps.get_model('properties', 'Variable')
+    Variable.objects.using(schema_editor.connection.alias).filter(
+        code__in=[var_data['code'] for var_data in CATALOG]
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0008_variable_drop_code_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_catalog, unseed_catalog),
+    ]
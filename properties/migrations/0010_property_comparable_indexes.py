@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:51
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0009_seed_variable_catalog'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['property_type', 'city', '-transaction_date'], name='prop_ptype_city_txdate_idx'),
+        ),
+    ]
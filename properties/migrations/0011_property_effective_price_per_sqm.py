@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:52
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0010_property_comparable_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='property',
+            name='effective_price_per_sqm',
+            field=models.GeneratedField(db_persist=True, expression=django.db.models.functions.comparison.Coalesce('price_per_sqm', models.Case(models.When(then=django.db.models.expressions.CombinedExpression(models.F('total_price'), '/', models.F('total_area')), total_area__gt=0, total_price__isnull=False))), output_field=models.DecimalField(decimal_places=2, max_digits=12), verbose_name='effective price per square meter'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['effective_price_per_sqm'], name='prop_eff_pps_idx'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:53
+
+import django.core.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0011_property_effective_price_per_sqm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='property',
+            name='latitude',
+            field=models.FloatField(blank=True, help_text='Latitude coordinate (for location-based analysis)', null=True, validators=[django.core.validators.MinValueValidator(-90), django.core.validators.MaxValueValidator(90)], verbose_name='latitude'),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='longitude',
+            field=models.FloatField(blank=True, help_text='Longitude coordinate (for location-based analysis)', null=True, validators=[django.core.validators.MinValueValidator(-180), django.core.validators.MaxValueValidator(180)], verbose_name='longitude'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('latitude__isnull', False)), fields=['latitude', 'longitude'], name='prop_lat_lon_idx'),
+        ),
+    ]
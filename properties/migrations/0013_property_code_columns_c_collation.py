@@ -0,0 +1,28 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0012_property_float_coordinates'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='property',
+            name='data_quality',
+            field=models.CharField(choices=[('high', 'High - Verified transaction'), ('medium', 'Medium - Secondary source'), ('low', 'Low - Estimated/unverified')], db_collation='C', default='medium', help_text='Reliability of this property data', max_length=20, verbose_name='data quality'),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='property_type',
+            field=models.CharField(choices=[('apartment', 'Apartment'), ('house', 'House')], db_collation='C', default='apartment', help_text='Type of property', max_length=20, verbose_name='property type'),
+        ),
+        migrations.AlterField(
+            model_name='property',
+            name='zip_code',
+            field=models.CharField(blank=True, db_collation='C', help_text='Postal/ZIP code', max_length=20, verbose_name='postal code'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 20:59
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0013_property_code_columns_c_collation'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['user', 'property_type', 'city'], name='prop_user_type_city_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:00
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0014_property_user_comparable_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='property',
+            name='transaction_date',
+            field=models.DateField(blank=True, db_index=True, help_text='Date of transaction (for market data)', null=True, verbose_name='transaction date'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:00
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0015_property_transaction_date_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='variable',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['choices'], name='var_choices_gin_idx'),
+        ),
+    ]
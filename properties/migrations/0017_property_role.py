@@ -0,0 +1,59 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+def roles_from_flags(apps, schema_editor):
+    """Subjects first: a row flagged as both was shown as a subject"""
+    Property = apps.get_model('properties', 'Property')
+    properties = Property.objects.using(schema_editor.connection.alias)
+    properties.filter(is_subject=True).update(role='subject')
+    properties.filter(is_subject=False, is_observed=False).update(role='other')
+
+
+def flags_from_roles(apps, schema_editor):
+    Property = apps.get_model('properties', 'Property')
+    properties = Property.objects.using(schema_editor.connection.alias)
+    properties.filter(role='subject').update(is_subject=True, is_observed=False)
+    properties.filter(role='other').update(is_subject=False, is_observed=False)
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0016_variable_choices_gin_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='property',
+            name='properties__is_subj_e9567e_idx',
+        ),
+        migrations.AddField(
+            model_name='property',
+            name='role',
+            field=models.CharField(choices=[('subject', 'Subject'), ('comparable', 'Comparable'), ('other', 'Other')], db_collation='C', default='comparable', help_text='Subject: the property being valued (target). Comparable: a property with known price (market data).', max_length=12, verbose_name='valuation role'),
+        ),
+        migrations.RunPython(roles_from_flags, flags_from_roles),
+        migrations.RemoveField(
+            model_name='property',
+            name='is_observed',
+        ),
+        migrations.RemoveField(
+            model_name='property',
+            name='is_subject',
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('role', 'comparable')), fields=['property_type'], name='prop_comparable_type_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(fields=['user', 'role', '-transaction_date'], name='prop_user_role_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='property',
+            index=models.Index(condition=models.Q(('data_quality', 'high'), ('role', 'comparable')), fields=['user', 'transaction_date'], name='prop_highqual_obs_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0017_property_role'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='variable',
+            constraint=models.CheckConstraint(condition=models.Q(('min_value__isnull', True), ('max_value__isnull', True), ('max_value__gte', models.F('min_value')), _connector='OR'), name='var_min_le_max'),
+        ),
+        migrations.AddConstraint(
+            model_name='variable',
+            constraint=models.CheckConstraint(condition=models.Q(models.Q(('data_type__in', ['qualitativa_ordinal', 'qualitativa_nominal']), _negated=True), ('choices__isnull', False), _connector='OR'), name='var_qualitative_has_choices'),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:05
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('properties', '0018_variable_check_constraints'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PropertyAttributeValue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value_num', models.FloatField(blank=True, help_text='Value of a quantitative variable', null=True, verbose_name='numeric value')),
+                ('value_text', models.CharField(blank=True, help_text='Option code of a qualitative variable', max_length=50, verbose_name='option')),
+                ('property', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.CASCADE, related_name='attr_values', to='properties.property', verbose_name='property')),
+                ('variable', models.ForeignKey(db_index=False, on_delete=django.db.models.deletion.PROTECT, related_name='property_values', to='properties.variable', verbose_name='variable')),
+            ],
+            options={
+                'verbose_name': 'property attribute value',
+                'verbose_name_plural': 'property attribute values',
+                'indexes': [models.Index(fields=['variable', 'value_num'], name='prop_attr_var_num_idx')],
+                'constraints': [models.UniqueConstraint(fields=('property', 'variable'), name='prop_attr_unique_variable')],
+            },
+        ),
+    ]
@@ -1,123 +1,222 @@
-from django.db import models
+from types import MappingProxyType
+
+import numpy as np
+from django.db import models, transaction
+from django.db.models import Case, F, Prefetch, Value, When
+from django.db.models.functions import Cast, Coalesce, Upper
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
+from django.core.exceptions import ValidationError
 from django.core.validators import MinValueValidator, MaxValueValidator
 
+from .geo import bounding_box, haversine_km
+
+# Regras de validação pelos valores que as formam; ver Variable.get_validation_rules
+_VALIDATION_RULES_CACHE = {}
+_VALIDATION_RULES_CACHE_SIZE = 4096
+
+# Variáveis de regressão por (banco, max(updated_at), total de linhas);
+# ver VariableManager.regression_vars
+_REGRESSION_VARS_CACHE = {}
+
+# Text search configuration for Property.search_vector and its queries
+SEARCH_CONFIG = 'portuguese'
+
+# Long role descriptions; see Property.get_role_display
+_ROLE_DISPLAY = MappingProxyType({
+    'subject': "Subject Property (Being Valued)",
+    'comparable': "Comparable Property (Market Data)",
+})
+
+# Tipo abreviado exibido nas listagens; ver Variable.get_type_display_short
+_TYPE_SHORT = MappingProxyType({
+    'quantitativa': 'QUANT',
+    'qualitativa_ordinal': 'QUAL-ORD',
+    'qualitativa_nominal': 'QUAL-NOM',
+})
+
+
+class VariableQuerySet(models.QuerySet):
+    """Consultas reutilizáveis sobre o catálogo de variáveis"""
+    
+    def with_parents(self):
+        """Carrega a variável origem no mesmo SELECT (evita N+1 ao exibir o pai)"""
+        return self.select_related('parent_variable')
+    
+    def with_tree(self):
+        """
+        Variável origem e variáveis derivadas em duas consultas no total.
+        
+        As derivadas vêm só com as colunas exibidas; parent_variable_id
+        precisa estar no only() para o Django associá-las ao pai sem uma
+        consulta extra por variável.
+        """
+        derived = Variable.objects.only(
+            'id', 'code', 'name', 'data_type', 'parent_variable_id',
+        )
+        return self.with_parents().prefetch_related(
+            Prefetch('derived_variables', queryset=derived)
+        )
+    
+    def with_choice(self, code):
+        """Variáveis qualitativas que oferecem a opção `code` (índice GIN em choices)"""
+        return self.filter(choices__has_key=code)
+
+
+class VariableManager(models.Manager.from_queryset(VariableQuerySet)):
+    """Manager de Variable com a lista de variáveis de regressão em cache"""
+    
+    def regression_vars(self):
+        """
+        Variáveis ativas marcadas para uso em regressão.
+        
+        O catálogo muda raramente; a lista é memorizada por banco e por
+        (max(updated_at), total de linhas). Toda gravação (save,
+        update_in_batches, cargas do catálogo) atualiza updated_at e
+        exclusões alteram o total, então cada chamada custa uma única
+        agregação em vez do SELECT das variáveis. A tupla e as instâncias
+        são compartilhadas entre chamadas: não devem ser alteradas.
+        """
+        version = self.aggregate(
+            last_update=models.Max('updated_at'),
+            total=models.Count('pk'),
+        )
+        key = (self.db, version['last_update'], version['total'])
+        variables = _REGRESSION_VARS_CACHE.get(key)
+        if variables is None:
+            variables = tuple(self.filter(use_in_regression=True, is_active=True))
+            _REGRESSION_VARS_CACHE.clear()
+            _REGRESSION_VARS_CACHE[key] = variables
+        return variables
+
+
+class ActiveVariableManager(models.Manager.from_queryset(VariableQuerySet)):
+    """Somente variáveis ativas (Variable.active), na ordem de var_order_idx"""
+    
+    def get_queryset(self):
+        return super().get_queryset().filter(is_active=True)
+
+
 class Variable(models.Model):
     """
     Catálogo global de variáveis para modelos de avaliação.
     
-    Define as características (variáveis independentes) que podem ser
-    coletadas para cada imóvel e usadas nos modelos de regressão linear.
+    Define as características que podem ser coletadas das propriedades
+    e utilizadas nos modelos de inferência estatística (NBR 14653).
     
-    Exemplo: área total, número de quartos, idade do imóvel, etc.
+    Compatível com o sistema SisDea.
     """
     
-    # Tipos de dados suportados
-    DATA_TYPE_CHOICES = [
-        ('decimal', 'Decimal (números com casas decimais)'),
-        ('integer', 'Inteiro (números inteiros)'),
-        ('boolean', 'Sim/Não (verdadeiro/falso)'),
-        ('text', 'Texto (texto livre)'),
-        ('choice', 'Escolha (opções pré-definidas)'),
-        ('date', 'Data'),
-        ('dicotomica', 'Dicotômica/Dummy (0 ou 1)'),  # Novo!
-    ]
+    # Tipos de dados (baseado em SisDea)
+    class DataType(models.TextChoices):
+        QUANTITATIVA = 'quantitativa', 'Quantitativa (Numérica)'
+        QUALITATIVA_ORDINAL = 'qualitativa_ordinal', 'Qualitativa Ordinal (Categorias Ordenadas)'
+        QUALITATIVA_NOMINAL = 'qualitativa_nominal', 'Qualitativa Nominal (Categorias)'
     
     # Categorias de variáveis (para organização)
-    CATEGORY_CHOICES = [
-        ('physical', 'Características Físicas'),
-        ('location', 'Localização'),
-        ('quality', 'Qualidade e Acabamento'),
-        ('legal', 'Aspectos Legais'),
-        ('economic', 'Aspectos Econômicos'),
-        ('temporal', 'Aspectos Temporais'),
-        ('proxy', 'Variáveis Proxy'),  # Novo!
-        ('dicotomica', 'Variáveis Dicotômicas'),  # Novo!
-        ('other', 'Outras'),
-    ]
-    
-    # Identificação
+    class Category(models.TextChoices):
+        DIMENSOES = 'dimensoes', 'Dimensões e Áreas'
+        LOCALIZACAO = 'localizacao', 'Localização'
+        CARACTERISTICAS = 'caracteristicas', 'Características Construtivas'
+        INFRAESTRUTURA = 'infraestrutura', 'Infraestrutura'
+        CONSERVACAO = 'conservacao', 'Estado de Conservação'
+        ECONOMICAS = 'economicas', 'Características Econômicas'
+        OUTRAS = 'outras', 'Outras'
+    
+    # Informações básicas
     code = models.CharField(
         'código',
         max_length=50,
         unique=True,
-        help_text='Código único para identificar a variável (ex: area_total, quartos)'
+        help_text='Código único da variável (ex: area_total, quartos, padrao)'
     )
     
     name = models.CharField(
         'nome',
         max_length=200,
-        help_text='Nome descritivo da variável em português'
+        help_text='Nome descritivo da variável'
     )
     
     description = models.TextField(
         'descrição',
         blank=True,
-        help_text='Descrição detalhada da variável e como medi-la'
-    )
-    
-    category = models.CharField(
-        'categoria',
-        max_length=20,
-        choices=CATEGORY_CHOICES,
-        default='physical',
-        help_text='Categoria para organização das variáveis'
+        help_text='Descrição detalhada da variável e como coletá-la'
     )
     
     # Tipo de dado
     data_type = models.CharField(
         'tipo de dado',
-        max_length=20,
-        choices=DATA_TYPE_CHOICES,
-        help_text='Tipo de dado que esta variável aceita'
+        max_length=25,
+        choices=DataType.choices,
+        help_text='Tipo de variável para análise estatística'
     )
     
+    # Unidade (para variáveis quantitativas)
     unit = models.CharField(
         'unidade',
         max_length=20,
         blank=True,
-        help_text='Unidade de medida (m², anos, unidades, etc.)'
+        help_text='Unidade de medida (m², anos, km, R$, etc.)'
     )
     
-    # Validações para tipos numéricos
+    # Restrições para variáveis quantitativas
     min_value = models.DecimalField(
         'valor mínimo',
         max_digits=15,
-        decimal_places=2,
+        decimal_places=4,
         null=True,
         blank=True,
-        help_text='Valor mínimo permitido (para dados numéricos)'
+        help_text='Valor mínimo permitido (para quantitativas)'
     )
     
     max_value = models.DecimalField(
         'valor máximo',
         max_digits=15,
-        decimal_places=2,
+        decimal_places=4,
         null=True,
         blank=True,
-        help_text='Valor máximo permitido (para dados numéricos)'
+        help_text='Valor máximo permitido (para quantitativas)'
     )
     
-    # Opções para tipo 'choice'
+    # Opções para variáveis qualitativas
     choices = models.JSONField(
         'opções',
         null=True,
         blank=True,
-        help_text='Lista de opções válidas para variáveis do tipo escolha. Ex: ["Baixo", "Médio", "Alto"]'
+        help_text='Opções para variáveis qualitativas (JSON: {"codigo": "descrição", ...})'
     )
     
-    # Metadados
+    # Ordem das opções (para ordinais)
+    choice_order = models.JSONField(
+        'ordem das opções',
+        null=True,
+        blank=True,
+        help_text='Ordem das opções para variáveis ordinais (JSON: ["codigo1", "codigo2", ...])'
+    )
+    
+    # Configurações
     is_required = models.BooleanField(
         'obrigatória',
         default=False,
-        help_text='Se marcado, esta variável deve ser preenchida para todos os imóveis'
+        help_text='Se marcado, esta variável deve ser preenchida para todos os dados'
     )
     
     is_active = models.BooleanField(
         'ativa',
         default=True,
-        help_text='Se desmarcado, esta variável não aparecerá para uso'
+        help_text='Se desmarcado, a variável não aparece para seleção'
+    )
+    
+    # Metadados
+    category = models.CharField(
+        'categoria',
+        max_length=50,
+        blank=True,
+        choices=Category.choices,
+        help_text='Categoria para organização'
     )
     
     display_order = models.IntegerField(
@@ -151,29 +250,68 @@ class Variable(models.Model):
     )
     
     # Timestamps
-    created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now=True)
+    created_at = models.DateTimeField(
+        'criado em',
+        auto_now_add=True
+    )
+    
+    updated_at = models.DateTimeField(
+        'atualizado em',
+        auto_now=True
+    )
+    
+    objects = VariableManager()
+    active = ActiveVariableManager()
     
     class Meta:
         verbose_name = 'variável'
         verbose_name_plural = 'variáveis'
         ordering = ['category', 'display_order', 'name']
+        # code is unique: its constraint index also serves lookups and the
+        # ON CONFLICT (code) upsert of the catalog sync
         indexes = [
-            models.Index(fields=['code']),
             models.Index(fields=['category', 'is_active']),
+            # Matches Meta.ordering; também serve Variable.active
+            models.Index(fields=['category', 'display_order', 'name'], name='var_order_idx'),
+            # Busca por opção (choices ? 'codigo'); ver VariableQuerySet.with_choice
+            GinIndex(fields=['choices'], name='var_choices_gin_idx'),
+        ]
+        # Garantidas também em bulk_create/bulk_update, que não chamam clean()
+        constraints = [
+            models.CheckConstraint(
+                condition=(
+                    models.Q(min_value__isnull=True)
+                    | models.Q(max_value__isnull=True)
+                    | models.Q(max_value__gte=F('min_value'))
+                ),
+                name='var_min_le_max',
+            ),
+            models.CheckConstraint(
+                condition=(
+                    ~models.Q(data_type__in=['qualitativa_ordinal', 'qualitativa_nominal'])
+                    | models.Q(choices__isnull=False)
+                ),
+                name='var_qualitative_has_choices',
+            ),
         ]
     
     def __str__(self):
         return f"{self.name} ({self.code})"
     
+    @property
+    def is_qualitative(self):
+        """Variáveis qualitativas (ordinais ou nominais) usam `choices`"""
+        return self.data_type in (
+            self.DataType.QUALITATIVA_ORDINAL,
+            self.DataType.QUALITATIVA_NOMINAL,
+        )
+    
     def clean(self):
-        """Validação customizada"""
-        from django.core.exceptions import ValidationError
-        
-        # Validar que choices existe para tipo 'choice'
-        if self.data_type == 'choice' and not self.choices:
+        """Validação customizada (mensagens por campo para as regras de Meta.constraints)"""
+        # Variáveis qualitativas precisam de opções
+        if self.is_qualitative and not self.choices:
             raise ValidationError({
-                'choices': 'Variáveis do tipo "Escolha" devem ter opções definidas.'
+                'choices': 'Variáveis qualitativas devem ter opções definidas.'
             })
         
         # Validar que min <= max
@@ -183,162 +321,64 @@ class Variable(models.Model):
                     'max_value': 'O valor máximo deve ser maior que o valor mínimo.'
                 })
         
-        # Limpar choices se não for tipo 'choice'
-        if self.data_type != 'choice':
+        # Limpar opções de variáveis quantitativas
+        if not self.is_qualitative:
             self.choices = None
+            self.choice_order = None
     
     def get_validation_rules(self):
-        """Retorna regras de validação em formato dict"""
+        """
+        Retorna regras de validação em formato dict.
+        
+        O resultado é memorizado pelos valores dos campos que formam as
+        regras, não por (pk, updated_at): uma instância alterada em memória
+        e ainda não salva (clean(), formulário do admin) recebe as regras
+        dos seus valores atuais.
+        """
+        choices = self.choices if self.is_qualitative else None
+        key = (
+            self.data_type,
+            self.is_required,
+            self.min_value,
+            self.max_value,
+            tuple(sorted(choices.items())) if choices else None,
+        )
+        try:
+            rules = _VALIDATION_RULES_CACHE.get(key)
+        except TypeError:
+            # Opções com valores não hasheáveis: monta sem cache
+            return self._build_validation_rules()
+        if rules is None:
+            if len(_VALIDATION_RULES_CACHE) >= _VALIDATION_RULES_CACHE_SIZE:
+                _VALIDATION_RULES_CACHE.clear()
+            rules = _VALIDATION_RULES_CACHE[key] = self._build_validation_rules()
+        # Cópia rasa: o chamador pode alterar o dict sem afetar o cache
+        return dict(rules)
+    
+    def _build_validation_rules(self):
+        """Monta as regras de validação a partir dos campos"""
         rules = {
             'type': self.data_type,
             'required': self.is_required,
         }
         
-        if self.data_type in ['decimal', 'integer']:
+        if self.data_type == self.DataType.QUANTITATIVA:
             if self.min_value is not None:
                 rules['min'] = float(self.min_value)
             if self.max_value is not None:
                 rules['max'] = float(self.max_value)
         
-        if self.data_type == 'choice' and self.choices:
-            rules['choices'] = self.choices
+        if self.is_qualitative and self.choices:
+            rules['choices'] = dict(self.choices)
         
         return rules
-    """
-    Catálogo global de variáveis para modelos de avaliação.
-    
-    Define as características que podem ser coletadas das propriedades
-    e utilizadas nos modelos de inferência estatística (NBR 14653).
-    
-    Compatível com o sistema SisDea.
-    """
-    
-    # Tipos de dados (baseado em SisDea)
-    DATA_TYPE_CHOICES = [
-        ('quantitativa', 'Quantitativa (Numérica)'),
-        ('qualitativa_ordinal', 'Qualitativa Ordinal (Categorias Ordenadas)'),
-        ('qualitativa_nominal', 'Qualitativa Nominal (Categorias)'),
-    ]
-    
-    # Informações básicas
-    code = models.CharField(
-        'código',
-        max_length=50,
-        unique=True,
-        help_text='Código único da variável (ex: area_total, quartos, padrao)'
-    )
-    
-    name = models.CharField(
-        'nome',
-        max_length=200,
-        help_text='Nome descritivo da variável'
-    )
-    
-    description = models.TextField(
-        'descrição',
-        blank=True,
-        help_text='Descrição detalhada da variável e como coletá-la'
-    )
-    
-    # Tipo de dado
-    data_type = models.CharField(
-        'tipo de dado',
-        max_length=25,
-        choices=DATA_TYPE_CHOICES,
-        help_text='Tipo de variável para análise estatística'
-    )
-    
-    # Unidade (para variáveis quantitativas)
-    unit = models.CharField(
-        'unidade',
-        max_length=20,
-        blank=True,
-        help_text='Unidade de medida (m², anos, km, R$, etc.)'
-    )
-    
-    # Restrições para variáveis quantitativas
-    min_value = models.DecimalField(
-        'valor mínimo',
-        max_digits=15,
-        decimal_places=4,
-        null=True,
-        blank=True,
-        help_text='Valor mínimo permitido (para quantitativas)'
-    )
-    
-    max_value = models.DecimalField(
-        'valor máximo',
-        max_digits=15,
-        decimal_places=4,
-        null=True,
-        blank=True,
-        help_text='Valor máximo permitido (para quantitativas)'
-    )
-    
-    # Opções para variáveis qualitativas
-    choices = models.JSONField(
-        'opções',
-        null=True,
-        blank=True,
-        help_text='Opções para variáveis qualitativas (JSON: {"codigo": "descrição", ...})'
-    )
-    
-    # Ordem das opções (para ordinais)
-    choice_order = models.JSONField(
-        'ordem das opções',
-        null=True,
-        blank=True,
-        help_text='Ordem das opções para variáveis ordinais (JSON: ["codigo1", "codigo2", ...])'
-    )
-    
-    # Configurações
-    is_required = models.BooleanField(
-        'obrigatória',
-        default=False,
-        help_text='Se marcado, esta variável deve ser preenchida para todos os dados'
-    )
-    
-    is_active = models.BooleanField(
-        'ativa',
-        default=True,
-        help_text='Se desmarcado, a variável não aparece para seleção'
-    )
-    
-    # Metadados
-    category = models.CharField(
-        'categoria',
-        max_length=50,
-        blank=True,
-        choices=[
-            ('dimensoes', 'Dimensões e Áreas'),
-            ('localizacao', 'Localização'),
-            ('caracteristicas', 'Características Construtivas'),
-            ('infraestrutura', 'Infraestrutura'),
-            ('conservacao', 'Estado de Conservação'),
-            ('economicas', 'Características Econômicas'),
-            ('outras', 'Outras'),
-        ],
-        help_text='Categoria para organização'
-    )
-    
-    created_at = models.DateTimeField(
-        'criado em',
-        auto_now_add=True
-    )
-    
-    updated_at = models.DateTimeField(
-        'atualizado em',
-        auto_now=True
-    )
-    def __str__(self):
-        return f"{self.name} ({self.code})"
     
     def get_choices_display(self):
         """Retorna as opções formatadas para exibição"""
         if not self.choices:
             return "N/A"
         
-        if self.data_type == 'qualitativa_ordinal' and self.choice_order:
+        if self.data_type == self.DataType.QUALITATIVA_ORDINAL and self.choice_order:
             # Ordenar pelas opções definidas
             return ', '.join([
                 f"{code}: {self.choices[code]}"
@@ -353,12 +393,156 @@ class Variable(models.Model):
     
     def get_type_display_short(self):
         """Retorna tipo abreviado"""
-        type_map = {
-            'quantitativa': 'QUANT',
-            'qualitativa_ordinal': 'QUAL-ORD',
-            'qualitativa_nominal': 'QUAL-NOM',
-        }
-        return type_map.get(self.data_type, self.data_type)
+        return _TYPE_SHORT.get(self.data_type, self.data_type)
+
+
+# Columns read by the regression feeders; see PropertyQuerySet.regression_rows
+REGRESSION_FIELDS = (
+    'id',
+    'total_area',
+    'effective_price_per_sqm',
+    'latitude',
+    'longitude',
+    'transaction_date',
+)
+
+# Record layout of PropertyQuerySet.regression_array (numeric columns only)
+REGRESSION_DTYPE = np.dtype([
+    ('id', np.int64),
+    ('total_area', np.float64),
+    ('effective_price_per_sqm', np.float64),
+    ('latitude', np.float64),
+    ('longitude', np.float64),
+])
+
+
+class PropertyQuerySet(models.QuerySet):
+    """Reusable read paths over properties"""
+    
+    def for_display(self):
+        """
+        Properties with their owner joined in the same SELECT.
+        
+        Avoids one query per row when listings or serializers show the
+        owner; the price per sqm is already a stored column
+        (effective_price_per_sqm).
+        """
+        return self.select_related('user')
+    
+    def regression_rows(self, user):
+        """
+        Comparable properties of `user` as dicts of REGRESSION_FIELDS.
+        
+        Skips the text columns and model instantiation; iterate with
+        .iterator(chunk_size=2000) to stream large samples.
+        """
+        return self.filter(user=user, role=Property.Role.COMPARABLE).values(*REGRESSION_FIELDS)
+    
+    def regression_array(self, user, chunk_size=2000):
+        """
+        Comparable properties of `user` as a REGRESSION_DTYPE structured array.
+        
+        Rows are streamed from a server-side cursor in `chunk_size` batches
+        straight into numpy.fromiter: no model instances, and numeric
+        columns arrive as floats (cast in SQL, NULL as NaN).
+        """
+        nan = Value(float('nan'), output_field=models.FloatField())
+        columns = [
+            Coalesce(Cast(name, models.FloatField()), nan)
+            for name in REGRESSION_DTYPE.names[1:]
+        ]
+        rows = (
+            self.filter(user=user, role=Property.Role.COMPARABLE)
+            .order_by()
+            .values_list('id', *columns)
+            .iterator(chunk_size=chunk_size)
+        )
+        return np.fromiter(rows, dtype=REGRESSION_DTYPE)
+    
+    def as_arrays(self, fields, dtype=np.float64):
+        """
+        Numeric columns of the queryset as {field: 1-D ndarray}.
+        
+        One values_list() query with every column cast to double precision
+        in SQL, so the driver returns floats instead of Decimal objects.
+        The rows are converted once into a column-major matrix, so every
+        returned array is a contiguous column ready for numpy.linalg.
+        NULLs become NaN. `fields` must be numeric columns.
+        """
+        fields = tuple(fields)
+        rows = list(self.values_list(*(Cast(field, models.FloatField()) for field in fields)))
+        matrix = np.asfortranarray(
+            np.array(rows, dtype=dtype).reshape(len(rows), len(fields))
+        )
+        return {field: matrix[:, i] for i, field in enumerate(fields)}
+    
+    def attribute_matrix(self, variables):
+        """
+        Numeric variable values of these properties as a dense matrix.
+        
+        Reads PropertyAttributeValue in one narrow query and pivots it with
+        numpy. Returns (property_ids, matrix): one row per property that has
+        at least one value, one column per entry of `variables` (Variable
+        instances or pks, in that order); missing values are NaN.
+        """
+        variable_ids = [getattr(variable, 'pk', variable) for variable in variables]
+        rows = list(
+            PropertyAttributeValue.objects.filter(
+                property__in=self.order_by().values('pk'),
+                variable__in=variable_ids,
+                value_num__isnull=False,
+            ).values_list('property_id', 'variable_id', 'value_num')
+        )
+        if not rows:
+            return np.empty(0, dtype=np.int64), np.empty((0, len(variable_ids)))
+        
+        property_col, variable_col, values = (np.array(col) for col in zip(*rows))
+        property_ids, row_index = np.unique(property_col, return_inverse=True)
+        column_of = {variable_id: i for i, variable_id in enumerate(variable_ids)}
+        column_index = np.fromiter(
+            (column_of[variable_id] for variable_id in variable_col.tolist()),
+            dtype=np.intp,
+            count=len(rows),
+        )
+        matrix = np.full((len(property_ids), len(variable_ids)), np.nan)
+        matrix[row_index, column_index] = values
+        return property_ids, matrix
+    
+    def bulk_ingest(self, rows, batch_size=1000):
+        """
+        Insert comparables from an iterable of field dicts in batches.
+        
+        Skips save() and its per-row work: the database fills
+        effective_price_per_sqm and search_vector, and each batch of
+        `batch_size` rows is one INSERT. Runs in one transaction and
+        returns the created instances (with pks on PostgreSQL).
+        """
+        objs = [self.model(**row) for row in rows]
+        with transaction.atomic(using=self.db):
+            return self.bulk_create(objs, batch_size=batch_size)
+    
+    def within_radius(self, latitude, longitude, radius_km):
+        """
+        Properties at most `radius_km` (great-circle) from the given point.
+        
+        A bounding box is applied in SQL (prop_lat_lon_idx) and the exact
+        haversine distance is evaluated on the candidates' coordinates
+        with numpy. Returns a queryset restricted to the matching pks.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+        candidates = self.filter(
+            latitude__isnull=False,
+            longitude__isnull=False,
+            latitude__range=(min_lat, max_lat),
+        )
+        if min_lon is not None:
+            candidates = candidates.filter(longitude__range=(min_lon, max_lon))
+        
+        columns = candidates.order_by().as_arrays(['id', 'latitude', 'longitude'])
+        distances = haversine_km(columns['latitude'], columns['longitude'], latitude, longitude)
+        pks = columns['id'][distances <= radius_km].astype(np.int64).tolist()
+        return self.filter(pk__in=pks)
+
 
 class Property(models.Model):
     """
@@ -373,15 +557,26 @@ class Property(models.Model):
     """
     
     # Property type choices
-    PROPERTY_TYPE_CHOICES = [
-        ('apartment', _('Apartment')),
-        ('house', _('House')),
-        # ('commercial', _('Commercial')),
-        # ('land', _('Land')),
-        # ('industrial', _('Industrial')),
-        # ('rural', _('Rural')),
-        # ('other', _('Other')),
-    ]
+    class PropertyType(models.TextChoices):
+        APARTMENT = 'apartment', _('Apartment')
+        HOUSE = 'house', _('House')
+        # COMMERCIAL = 'commercial', _('Commercial')
+        # LAND = 'land', _('Land')
+        # INDUSTRIAL = 'industrial', _('Industrial')
+        # RURAL = 'rural', _('Rural')
+        # OTHER = 'other', _('Other')
+    
+    # Role in valuation models
+    class Role(models.TextChoices):
+        SUBJECT = 'subject', _('Subject')
+        COMPARABLE = 'comparable', _('Comparable')
+        OTHER = 'other', _('Other')
+    
+    # Reliability of the market data
+    class DataQuality(models.TextChoices):
+        HIGH = 'high', _('High - Verified transaction')
+        MEDIUM = 'medium', _('Medium - Secondary source')
+        LOW = 'low', _('Low - Estimated/unverified')
     
     # Ownership and identification
     user = models.ForeignKey(
@@ -400,8 +595,9 @@ class Property(models.Model):
     property_type = models.CharField(
         _('property type'),
         max_length=20,
-        choices=PROPERTY_TYPE_CHOICES,
-        default='apartment',
+        db_collation='C',
+        choices=PropertyType.choices,
+        default=PropertyType.APARTMENT,
         help_text=_('Type of property')
     )
     
@@ -441,6 +637,7 @@ class Property(models.Model):
         _('postal code'),
         max_length=20,
         blank=True,
+        db_collation='C',
         help_text=_('Postal/ZIP code')
     )
     
@@ -452,20 +649,16 @@ class Property(models.Model):
     )
     
     # Geographic coordinates (for distance calculations in models)
-    latitude = models.DecimalField(
+    latitude = models.FloatField(
         _('latitude'),
-        max_digits=10,
-        decimal_places=7,
         null=True,
         blank=True,
         validators=[MinValueValidator(-90), MaxValueValidator(90)],
         help_text=_('Latitude coordinate (for location-based analysis)')
     )
     
-    longitude = models.DecimalField(
+    longitude = models.FloatField(
         _('longitude'),
-        max_digits=10,
-        decimal_places=7,
         null=True,
         blank=True,
         validators=[MinValueValidator(-180), MaxValueValidator(180)],
@@ -503,24 +696,41 @@ class Property(models.Model):
         help_text=_('Total built area in square meters')
     )
     
+    # price_per_sqm when informed, otherwise total_price / total_area;
+    # computed and stored by the database on every write
+    effective_price_per_sqm = models.GeneratedField(
+        expression=Coalesce(
+            'price_per_sqm',
+            Case(
+                When(
+                    total_price__isnull=False,
+                    total_area__gt=0,
+                    then=F('total_price') / F('total_area'),
+                ),
+            ),
+        ),
+        output_field=models.DecimalField(max_digits=12, decimal_places=2),
+        db_persist=True,
+        verbose_name=_('effective price per square meter'),
+    )
+    
     transaction_date = models.DateField(
         _('transaction date'),
         null=True,
         blank=True,
+        db_index=True,
         help_text=_('Date of transaction (for market data)')
     )
     
     # Property role in valuation models
-    is_subject = models.BooleanField(
-        _('is subject property'),
-        default=False,
-        help_text=_('Mark as TRUE if this is the property being valued (target)')
-    )
-    
-    is_observed = models.BooleanField(
-        _('is observed/comparable'),
-        default=True,
-        help_text=_('Mark as TRUE if this is a comparable property with known price')
+    role = models.CharField(
+        _('valuation role'),
+        max_length=12,
+        db_collation='C',
+        choices=Role.choices,
+        default=Role.COMPARABLE,
+        help_text=_('Subject: the property being valued (target). '
+                    'Comparable: a property with known price (market data).')
     )
     
     # Data source and quality
@@ -534,12 +744,9 @@ class Property(models.Model):
     data_quality = models.CharField(
         _('data quality'),
         max_length=20,
-        choices=[
-            ('high', _('High - Verified transaction')),
-            ('medium', _('Medium - Secondary source')),
-            ('low', _('Low - Estimated/unverified')),
-        ],
-        default='medium',
+        db_collation='C',
+        choices=DataQuality.choices,
+        default=DataQuality.MEDIUM,
         help_text=_('Reliability of this property data')
     )
     
@@ -554,50 +761,241 @@ class Property(models.Model):
         help_text=_('Last time this property data was updated')
     )
     
+    # Full-text search document, maintained by the database
+    search_vector = models.GeneratedField(
+        expression=SearchVector(
+            'name', 'street_address', 'neighborhood', 'city', 'description',
+            config=SEARCH_CONFIG,
+        ),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    
+    objects = PropertyQuerySet.as_manager()
+    
+    # Column values as loaded from the database; see save()
+    _loaded_pk = None
+    _loaded_values = None
+    
     class Meta:
         verbose_name = _('property')
         verbose_name_plural = _('properties')
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['user', '-created_at']),
-            models.Index(fields=['is_subject', 'is_observed']),
             models.Index(fields=['city', 'property_type']),
+            # Default ordering
+            models.Index(fields=['-created_at'], name='prop_created_desc_idx'),
+            # Comparable selection: same type and city, most recent first
+            models.Index(
+                fields=['property_type', 'city', '-transaction_date'],
+                name='prop_ptype_city_txdate_idx',
+            ),
+            models.Index(
+                fields=['property_type'],
+                condition=models.Q(role='comparable'),
+                name='prop_comparable_type_idx',
+            ),
+            # Per-user comparable fetches (regression inputs), most recent
+            # transactions first, and typed geographic searches per user
+            models.Index(
+                fields=['user', 'role', '-transaction_date'],
+                name='prop_user_role_date_idx',
+            ),
+            models.Index(
+                fields=['user', 'property_type', 'city'],
+                name='prop_user_type_city_idx',
+            ),
+            # Regression windows over verified comparables
+            models.Index(
+                fields=['user', 'transaction_date'],
+                condition=models.Q(role='comparable', data_quality='high'),
+                name='prop_highqual_obs_idx',
+            ),
+            # Admin sortable columns (PropertyAdmin.sortable_by)
+            models.Index(fields=['name'], name='prop_name_idx'),
+            models.Index(fields=['effective_price_per_sqm'], name='prop_eff_pps_idx'),
+            # Admin city/state filters: istartswith compiles to
+            # UPPER(col::text) LIKE 'X%', which needs a pattern opclass
+            models.Index(
+                OpClass(Upper('city'), name='text_pattern_ops'),
+                name='prop_city_upper_idx',
+            ),
+            models.Index(
+                OpClass(Upper('state'), name='text_pattern_ops'),
+                name='prop_state_upper_idx',
+            ),
+            GinIndex(fields=['search_vector'], name='prop_search_idx'),
+            # Bounding-box prefilter for distance queries on comparables
+            models.Index(
+                fields=['latitude', 'longitude'],
+                name='prop_lat_lon_idx',
+                condition=models.Q(latitude__isnull=False),
+            ),
         ]
     
     def __str__(self):
-        role = "Subject" if self.is_subject else "Comparable"
+        role = "Subject" if self.role == self.Role.SUBJECT else "Comparable"
         return f"{self.name} ({role}) - {self.city}"
     
     def get_role_display(self):
         """Return human-readable role in valuation"""
-        if self.is_subject:
-            return "Subject Property (Being Valued)"
-        elif self.is_observed:
-            return "Comparable Property (Market Data)"
-        else:
-            return "Property Data"
+        return _ROLE_DISPLAY.get(self.role, "Property Data")
     
-    def get_full_address(self):
-        """Return formatted full address"""
-        parts = [
+    @cached_property
+    def full_address(self):
+        """
+        Formatted full address, built once per instance.
+        
+        Dropped on save() and refresh_from_db() so it follows the stored
+        address fields.
+        """
+        return ', '.join(filter(None, (
             self.street_address,
             self.neighborhood,
             self.city,
             self.state,
             self.zip_code,
-            self.country
-        ]
-        return ', '.join(filter(None, parts))
+            self.country,
+        )))
+    
+    def get_full_address(self):
+        """Return formatted full address"""
+        return self.full_address
     
     def calculate_price_per_sqm(self):
         """Calculate price per sqm if total price and area are known"""
-        if self.total_price and self.total_area and self.total_area > 0:
-            return self.total_price / self.total_area
+        total_price, total_area = self.total_price, self.total_area
+        if total_price and total_area and total_area > 0:
+            return total_price / total_area
         return self.price_per_sqm
     
+    @staticmethod
+    def batch_price_per_sqm(total_prices, total_areas):
+        """
+        Vectorized total_price / total_area over numpy arrays.
+        
+        Rows without a positive area (or with NaN inputs, see
+        PropertyQuerySet.as_arrays) give NaN.
+        """
+        total_prices = np.asarray(total_prices, dtype=np.float64)
+        total_areas = np.asarray(total_areas, dtype=np.float64)
+        result = np.full(np.broadcast(total_prices, total_areas).shape, np.nan)
+        np.divide(total_prices, total_areas, out=result, where=total_areas > 0)
+        return result
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._loaded_pk = instance.pk
+        instance._loaded_values = instance._tracked_values()
+        return instance
+    
+    def _tracked_values(self):
+        """Current values of the loaded, user-writable columns by field name"""
+        deferred = self.get_deferred_fields()
+        return {
+            field.name: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if not (field.primary_key or field.generated or field.name == 'updated_at')
+            and field.attname not in deferred
+        }
+    
     def save(self, *args, **kwargs):
-        """Auto-calculate price_per_sqm if not provided"""
-        if not self.price_per_sqm and self.total_price and self.total_area:
-            if self.total_area > 0:
-                self.price_per_sqm = self.total_price / self.total_area
-        super().save(*args, **kwargs)
\ No newline at end of file
+        """
+        Write only the columns that changed since the row was loaded.
+        
+        A plain save() of a loaded instance compares the loaded values
+        with the current ones: nothing changed means no UPDATE at all,
+        otherwise only the changed columns (plus updated_at) are written.
+        Saves with explicit arguments, and clones (pk cleared or changed
+        since loading), behave as usual. Generated columns are reloaded
+        from the database on their next access.
+        """
+        self.__dict__.pop('full_address', None)
+        if (
+            self._loaded_values is not None
+            and not args and not kwargs
+            and not self._state.adding
+            and self.pk is not None
+            and self.pk == self._loaded_pk
+        ):
+            current = self._tracked_values()
+            changed = [
+                name for name, value in current.items()
+                if name not in self._loaded_values or self._loaded_values[name] != value
+            ]
+            if not changed:
+                return
+            kwargs['update_fields'] = changed + ['updated_at']
+        super().save(*args, **kwargs)
+        # Generated columns are recomputed by the database: reload on access
+        for field in self._meta.concrete_fields:
+            if field.generated:
+                self.__dict__.pop(field.attname, None)
+        self._loaded_pk = self.pk
+        self._loaded_values = self._tracked_values()
+    
+    def refresh_from_db(self, *args, **kwargs):
+        self.__dict__.pop('full_address', None)
+        super().refresh_from_db(*args, **kwargs)
+        self._loaded_pk = self.pk
+        self._loaded_values = self._tracked_values()
+
+
+class PropertyAttributeValue(models.Model):
+    """
+    Value of a catalog Variable for one Property (long format).
+    
+    Quantitative variables use value_num; qualitative ones store the
+    option code in value_text. Regression inputs are read with
+    PropertyQuerySet.attribute_matrix.
+    """
+    
+    property = models.ForeignKey(
+        Property,
+        on_delete=models.CASCADE,
+        related_name='attr_values',
+        verbose_name=_('property'),
+        db_index=False,  # leading column of prop_attr_unique_variable
+    )
+    
+    variable = models.ForeignKey(
+        Variable,
+        on_delete=models.PROTECT,
+        related_name='property_values',
+        verbose_name=_('variable'),
+        db_index=False,  # leading column of prop_attr_var_num_idx
+    )
+    
+    value_num = models.FloatField(
+        _('numeric value'),
+        null=True,
+        blank=True,
+        help_text=_('Value of a quantitative variable')
+    )
+    
+    value_text = models.CharField(
+        _('option'),
+        max_length=50,
+        blank=True,
+        help_text=_('Option code of a qualitative variable')
+    )
+    
+    class Meta:
+        verbose_name = _('property attribute value')
+        verbose_name_plural = _('property attribute values')
+        constraints = [
+            models.UniqueConstraint(
+                fields=['property', 'variable'],
+                name='prop_attr_unique_variable',
+            ),
+        ]
+        indexes = [
+            # Predicates on a variable's value (e.g. area > 80) in SQL
+            models.Index(fields=['variable', 'value_num'], name='prop_attr_var_num_idx'),
+        ]
+    
+    def __str__(self):
+        value = self.value_text if self.value_num is None else self.value_num
+        return f"{self.variable_id}={value} (property {self.property_id})"
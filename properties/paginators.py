@@ -0,0 +1,46 @@
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids SELECT COUNT(*) on large, unfiltered tables.
+
+    On PostgreSQL the row count of an unfiltered change-list is read from
+    the planner statistics (pg_class.reltuples), a single catalog lookup.
+    Filtered or searched querysets, small tables, tables that were never
+    analyzed and other database backends use the exact count.
+    """
+
+    # Below this estimate an exact COUNT(*) is cheap enough
+    exact_count_threshold = 10000
+
+    @cached_property
+    def count(self):
+        estimate = self._estimated_count()
+        if estimate is None or estimate < self.exact_count_threshold:
+            return super().count
+        return estimate
+
+    def _estimated_count(self):
+        """Return the planner's row estimate, or None when it does not apply"""
+        queryset = self.object_list
+        query = getattr(queryset, 'query', None)
+        if query is None or query.where or query.distinct:
+            return None
+
+        connection = connections[queryset.db]
+        if connection.vendor != 'postgresql':
+            return None
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                'SELECT reltuples FROM pg_class WHERE oid = to_regclass(%s)',
+                [connection.ops.quote_name(queryset.model._meta.db_table)],
+            )
+            row = cursor.fetchone()
+        # reltuples is -1 (PostgreSQL 14+) or 0 until the table is analyzed
+        if row is None or row[0] <= 0:
+            return None
+        return int(row[0])
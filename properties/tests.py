@@ -1,3 +1,470 @@
-from django.test import TestCase
+import math
+from datetime import date
+from decimal import Decimal
+from unittest import mock
 
-# Create your tests here.
+import numpy as np
+
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME
+from django.contrib.postgres.search import SearchQuery
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import User
+from .admin import update_by_pk_array, update_in_batches
+from .catalog import VARIABLES, sync_variable_catalog
+from .geo import EARTH_RADIUS_KM, KM_PER_DEGREE, bounding_box, haversine_km
+from .models import (
+    REGRESSION_DTYPE, SEARCH_CONFIG, Property, PropertyAttributeValue, Variable,
+)
+from .paginators import EstimatedCountPaginator
+
+
+def make_property(user, **fields):
+    """Create a Property with the required address fields filled in"""
+    values = {
+        'name': 'Imóvel', 'street_address': 'Rua 1', 'city': 'Rio', 'state': 'RJ',
+    }
+    values.update(fields)
+    return Property.objects.create(user=user, **values)
+
+
+class PropertySaveTests(TestCase):
+    """save() of a loaded Property writes only the columns that changed"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw', name='Owner')
+        cls.property_id = make_property(
+            cls.user, name='Casa', total_price=100000, total_area=50,
+        ).pk
+
+    def test_unchanged_save_makes_no_query(self):
+        prop = Property.objects.get(pk=self.property_id)
+        with self.assertNumQueries(0):
+            prop.save()
+
+    def test_save_writes_changed_columns_and_updated_at(self):
+        prop = Property.objects.get(pk=self.property_id)
+        prop.city = 'Niterói'
+        with CaptureQueriesContext(connection) as ctx:
+            prop.save()
+        self.assertEqual(len(ctx.captured_queries), 1)
+        sql = ctx.captured_queries[0]['sql']
+        set_clause = sql[sql.index(' SET ') + 5:sql.index(' WHERE ')]
+        columns = sorted(part.split(' = ')[0].strip('"') for part in set_clause.split(', '))
+        self.assertEqual(columns, ['city', 'updated_at'])
+        self.assertEqual(Property.objects.get(pk=self.property_id).city, 'Niterói')
+
+    def test_second_save_after_write_makes_no_query(self):
+        prop = Property.objects.get(pk=self.property_id)
+        prop.name = 'Casa nova'
+        prop.save()
+        with self.assertNumQueries(0):
+            prop.save()
+
+    def test_clone_with_cleared_pk_inserts_a_row(self):
+        prop = Property.objects.get(pk=self.property_id)
+        prop.pk = None
+        prop.save()
+        self.assertNotEqual(prop.pk, self.property_id)
+        self.assertEqual(Property.objects.count(), 2)
+
+    def test_save_after_delete_inserts_a_row(self):
+        prop = Property.objects.get(pk=self.property_id)
+        prop.delete()
+        prop.save()
+        self.assertEqual(Property.objects.count(), 1)
+        self.assertTrue(Property.objects.filter(pk=prop.pk).exists())
+
+
+
+class VariableCatalogSyncTests(TestCase):
+    """sync_variable_catalog() writes only variables that differ from VARIABLES"""
+
+    def test_up_to_date_catalog_is_one_select(self):
+        # Migration 0009 already seeded the catalog
+        with CaptureQueriesContext(connection) as ctx:
+            created, updated = sync_variable_catalog()
+        self.assertEqual((created, updated), ([], []))
+        statements = [
+            query['sql'] for query in ctx.captured_queries
+            if 'SAVEPOINT' not in query['sql']
+        ]
+        self.assertEqual(len(statements), 1)
+        self.assertTrue(statements[0].startswith('SELECT'))
+
+    def test_only_changed_and_missing_rows_are_written(self):
+        first, second = VARIABLES[0]['code'], VARIABLES[1]['code']
+        Variable.objects.filter(code=first).update(name='Editado')
+        Variable.objects.filter(code=second).delete()
+        untouched = dict(
+            Variable.objects.exclude(code=first).values_list('code', 'updated_at')
+        )
+
+        created, updated = sync_variable_catalog()
+
+        self.assertEqual(created, [second])
+        self.assertEqual(updated, [first])
+        self.assertEqual(Variable.objects.get(code=first).name, VARIABLES[0]['name'])
+        self.assertEqual(
+            dict(Variable.objects.filter(code__in=untouched).values_list('code', 'updated_at')),
+            untouched,
+        )
+
+
+
+class VariableValidationRulesTests(TestCase):
+    """get_validation_rules() follows the instance's current field values"""
+
+    def test_unsaved_changes_are_reflected(self):
+        variable = Variable.objects.get(code='area_total')
+        self.assertEqual(variable.get_validation_rules()['max'], 100000)
+        variable.max_value = 500
+        self.assertEqual(variable.get_validation_rules()['max'], 500)
+
+    def test_unsaved_choices_are_reflected(self):
+        variable = Variable.objects.get(code='padrao')
+        variable.get_validation_rules()
+        variable.choices = {'unico': 'Único'}
+        self.assertEqual(variable.get_validation_rules()['choices'], {'unico': 'Único'})
+
+    def test_returned_rules_can_be_mutated(self):
+        variable = Variable.objects.get(code='area_total')
+        variable.get_validation_rules()['max'] = 1
+        self.assertEqual(variable.get_validation_rules()['max'], 100000)
+
+
+
+class UpdateInBatchesTests(TestCase):
+    """Admin bulk actions update the selection and keep updated_at current"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_superuser('admin@example.com', 'pw')
+        cls.properties = [make_property(cls.user, name=f'P{i}') for i in range(3)]
+
+    def test_sets_values_and_updated_at(self):
+        before = timezone.now()
+        queryset = Property.objects.filter(pk__in=[p.pk for p in self.properties[:2]])
+        updated = update_in_batches(queryset, data_quality=Property.DataQuality.HIGH)
+        self.assertEqual(updated, 2)
+        rows = Property.objects.order_by('name').values_list('data_quality', 'updated_at')
+        self.assertEqual([quality for quality, _ in rows], ['high', 'high', 'medium'])
+        self.assertTrue(all(updated_at >= before for _, updated_at in rows[:2]))
+        self.assertLess(rows[2][1], before)
+
+    def test_admin_action_updates_selection(self):
+        self.client.force_login(self.user)
+        pks = [p.pk for p in self.properties]
+        response = self.client.post(reverse('admin:properties_property_changelist'), {
+            'action': 'mark_as_subject',
+            ACTION_CHECKBOX_NAME: pks,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(
+            Property.objects.filter(pk__in=pks, role=Property.Role.SUBJECT).count(), 3
+        )
+
+
+    def test_large_selection_is_one_array_update(self):
+        queryset = Property.objects.all()
+        with mock.patch('properties.admin.UPDATE_BATCH_SIZE', 2):
+            with CaptureQueriesContext(connection) as ctx:
+                updated = update_in_batches(queryset, role=Property.Role.OTHER)
+        self.assertEqual(updated, 3)
+        updates = [q['sql'] for q in ctx.captured_queries if q['sql'].startswith('UPDATE')]
+        self.assertEqual(len(updates), 1)
+        self.assertIn('= ANY(', updates[0])
+        self.assertEqual(Property.objects.filter(role=Property.Role.OTHER).count(), 3)
+
+    def test_update_by_pk_array_touches_only_given_pks(self):
+        first, second, third = self.properties
+        updated = update_by_pk_array(
+            Property, 'default', [first.pk, third.pk],
+            {'total_area': Decimal('75.50'), 'transaction_date': date(2024, 5, 1)},
+        )
+        self.assertEqual(updated, 2)
+        rows = dict(Property.objects.values_list('pk', 'total_area'))
+        self.assertEqual(rows, {first.pk: Decimal('75.50'), second.pk: None, third.pk: Decimal('75.50')})
+        self.assertEqual(
+            Property.objects.get(pk=third.pk).transaction_date, date(2024, 5, 1)
+        )
+
+
+
+class EstimatedCountPaginatorTests(TestCase):
+    """Unfiltered counts come from pg_class.reltuples once the table is large"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw')
+        for i in range(3):
+            make_property(cls.user, name=f'P{i}', city='Rio' if i else 'Niterói')
+
+    def analyze(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Property._meta.db_table}')
+
+    def paginator(self, queryset, threshold=1):
+        paginator = EstimatedCountPaginator(queryset, 100)
+        paginator.exact_count_threshold = threshold
+        return paginator
+
+    def test_unfiltered_count_uses_estimate(self):
+        self.analyze()
+        make_property(self.user, name='Depois do ANALYZE')
+        # The estimate still reflects the three analyzed rows
+        self.assertEqual(self.paginator(Property.objects.all()).count, 3)
+
+    def test_small_estimate_uses_exact_count(self):
+        self.analyze()
+        make_property(self.user, name='Depois do ANALYZE')
+        self.assertEqual(self.paginator(Property.objects.all(), threshold=10).count, 4)
+
+    def test_filtered_queryset_uses_exact_count(self):
+        self.analyze()
+        with CaptureQueriesContext(connection) as ctx:
+            count = self.paginator(Property.objects.filter(city='Rio')).count
+        self.assertEqual(count, 2)
+        self.assertFalse(any('reltuples' in q['sql'] for q in ctx.captured_queries))
+
+    def test_table_never_analyzed_uses_exact_count(self):
+        self.analyze()
+        # TRUNCATE gives the table a new file whose reltuples is unknown (-1)
+        with connection.cursor() as cursor:
+            cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+            cursor.execute(f'TRUNCATE {Property._meta.db_table} CASCADE')
+        make_property(self.user, name='Após TRUNCATE')
+        paginator = self.paginator(Property.objects.all())
+        self.assertIsNone(paginator._estimated_count())
+        self.assertEqual(paginator.count, 1)
+
+
+
+class GeoTests(SimpleTestCase):
+    """Great-circle distances and the bounding box used to prefilter them"""
+
+    def test_haversine_known_distances(self):
+        distances = haversine_km(np.array([0.0, 1.0, 0.0]), np.array([0.0, 0.0, 180.0]), 0.0, 0.0)
+        self.assertAlmostEqual(distances[0], 0.0)
+        self.assertAlmostEqual(distances[1], KM_PER_DEGREE, places=6)
+        self.assertAlmostEqual(distances[2], math.pi * EARTH_RADIUS_KM, places=6)
+
+    def test_bounding_box_contains_circle(self):
+        min_lat, max_lat, min_lon, max_lon = bounding_box(-22.9, -43.2, 10)
+        self.assertAlmostEqual(max_lat - min_lat, 20 / KM_PER_DEGREE)
+        self.assertGreater(max_lon - min_lon, max_lat - min_lat)
+
+    def test_bounding_box_near_pole_drops_longitude(self):
+        self.assertEqual(bounding_box(89.95, 10.0, 50)[1:], (90.0, None, None))
+        self.assertEqual(bounding_box(-89.95, 10.0, 50)[0], -90.0)
+
+    def test_bounding_box_across_antimeridian_drops_longitude(self):
+        self.assertEqual(bounding_box(0.0, 179.95, 20)[2:], (None, None))
+        self.assertEqual(bounding_box(0.0, -179.95, 20)[2:], (None, None))
+
+
+class WithinRadiusTests(TestCase):
+    """PropertyQuerySet.within_radius() keeps exactly the points in the circle"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw')
+
+    def place(self, name, latitude, longitude):
+        return make_property(self.user, name=name, latitude=latitude, longitude=longitude)
+
+    def names(self, queryset):
+        return sorted(queryset.values_list('name', flat=True))
+
+    def test_radius_filters_by_great_circle_distance(self):
+        self.place('centro', -22.9, -43.2)
+        # 0.045° of latitude is ~5 km, 0.18° is ~20 km
+        self.place('perto', -22.9 + 0.045, -43.2)
+        self.place('longe', -22.9 + 0.18, -43.2)
+        make_property(self.user, name='sem coordenadas')
+        self.assertEqual(
+            self.names(Property.objects.within_radius(-22.9, -43.2, 10)), ['centro', 'perto']
+        )
+
+    def test_radius_across_antimeridian(self):
+        self.place('leste', 0.0, 179.95)
+        self.place('oeste', 0.0, -179.95)
+        self.place('longe', 0.0, 170.0)
+        self.assertEqual(
+            self.names(Property.objects.within_radius(0.0, 179.95, 20)), ['leste', 'oeste']
+        )
+
+    def test_radius_across_pole(self):
+        self.place('a', 89.95, 0.0)
+        self.place('b', 89.95, 180.0)
+        self.place('longe', 80.0, 0.0)
+        self.assertEqual(self.names(Property.objects.within_radius(89.95, 0.0, 20)), ['a', 'b'])
+
+
+
+class AttributeMatrixTests(TestCase):
+    """attribute_matrix() pivots long-format values into one row per property"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw')
+        cls.area = Variable.objects.get(code='area_total')
+        cls.rooms = Variable.objects.get(code='quartos')
+        cls.finish = Variable.objects.get(code='padrao')
+        cls.first = make_property(cls.user, name='P1')
+        cls.second = make_property(cls.user, name='P2')
+        cls.without_values = make_property(cls.user, name='P3')
+        PropertyAttributeValue.objects.bulk_create([
+            PropertyAttributeValue(property=cls.first, variable=cls.area, value_num=80.0),
+            PropertyAttributeValue(property=cls.first, variable=cls.rooms, value_num=2.0),
+            PropertyAttributeValue(property=cls.first, variable=cls.finish, value_text='alto'),
+            PropertyAttributeValue(property=cls.second, variable=cls.rooms, value_num=3.0),
+        ])
+
+    def test_pivot_follows_variable_order_with_nan_for_missing(self):
+        ids, matrix = Property.objects.all().attribute_matrix([self.rooms, self.area.pk])
+        self.assertEqual(ids.tolist(), sorted([self.first.pk, self.second.pk]))
+        rows = dict(zip(ids.tolist(), matrix.tolist()))
+        self.assertEqual(rows[self.first.pk], [2.0, 80.0])
+        self.assertEqual(rows[self.second.pk][0], 3.0)
+        self.assertTrue(math.isnan(rows[self.second.pk][1]))
+
+    def test_restricted_to_the_queryset(self):
+        ids, matrix = Property.objects.filter(pk=self.second.pk).attribute_matrix([self.rooms])
+        self.assertEqual(ids.tolist(), [self.second.pk])
+        self.assertEqual(matrix.tolist(), [[3.0]])
+
+    def test_no_values_gives_empty_matrix(self):
+        ids, matrix = Property.objects.filter(pk=self.without_values.pk).attribute_matrix(
+            [self.area, self.rooms]
+        )
+        self.assertEqual(ids.shape, (0,))
+        self.assertEqual(matrix.shape, (0, 2))
+
+    def test_one_value_per_property_and_variable(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            PropertyAttributeValue.objects.create(
+                property=self.second, variable=self.rooms, value_num=4.0
+            )
+
+
+
+class BulkIngestTests(TestCase):
+    """bulk_ingest() inserts in batches and lets the database fill generated columns"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw')
+
+    def rows(self, count):
+        return [
+            {
+                'user': self.user, 'name': f'Apartamento {i}', 'street_address': 'Rua 1',
+                'city': 'Niterói', 'state': 'RJ', 'total_price': 100000 * (i + 1),
+                'total_area': 50,
+            }
+            for i in range(count)
+        ]
+
+    def test_inserts_in_batches_and_returns_pks(self):
+        with CaptureQueriesContext(connection) as ctx:
+            created = Property.objects.bulk_ingest(self.rows(5), batch_size=2)
+        inserts = [q for q in ctx.captured_queries if q['sql'].startswith('INSERT')]
+        self.assertEqual(len(inserts), 3)
+        self.assertEqual(len(created), 5)
+        self.assertTrue(all(prop.pk for prop in created))
+        self.assertEqual(Property.objects.count(), 5)
+
+    def test_generated_columns_are_filled(self):
+        [created] = Property.objects.bulk_ingest(self.rows(1))
+        prop = Property.objects.get(pk=created.pk)
+        self.assertEqual(prop.effective_price_per_sqm, Decimal('2000.00'))
+        query = SearchQuery('Niterói', config=SEARCH_CONFIG)
+        self.assertTrue(Property.objects.filter(pk=prop.pk, search_vector=query).exists())
+
+
+
+class RegressionArrayTests(TestCase):
+    """regression_array() returns the user's comparables as a structured array"""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('owner@example.com', 'pw')
+        other_user = User.objects.create_user('other@example.com', 'pw')
+        cls.complete = make_property(
+            cls.user, name='Completo', total_price=300000, total_area=100,
+            latitude=-22.9, longitude=-43.2,
+        )
+        cls.partial = make_property(cls.user, name='Sem dados')
+        make_property(cls.user, name='Avaliando', role=Property.Role.SUBJECT, total_area=70)
+        make_property(other_user, name='Outro usuário', total_area=60)
+
+    def test_dtype_rows_and_nan_for_null(self):
+        array = Property.objects.regression_array(self.user, chunk_size=1)
+        self.assertEqual(array.dtype, REGRESSION_DTYPE)
+        rows = {int(row['id']): row for row in array}
+        self.assertEqual(set(rows), {self.complete.pk, self.partial.pk})
+
+        complete = rows[self.complete.pk]
+        self.assertEqual(complete['total_area'], 100.0)
+        self.assertEqual(complete['effective_price_per_sqm'], 3000.0)
+        self.assertAlmostEqual(complete['latitude'], -22.9)
+        self.assertTrue(all(
+            math.isnan(rows[self.partial.pk][name]) for name in REGRESSION_DTYPE.names[1:]
+        ))
+
+    def test_no_comparables_gives_empty_array(self):
+        array = Property.objects.regression_array(User.objects.create_user('new@example.com', 'pw'))
+        self.assertEqual(array.shape, (0,))
+        self.assertEqual(array.dtype, REGRESSION_DTYPE)
+
+
+class RoleMigrationTests(TransactionTestCase):
+    """0017 maps the is_subject/is_observed flags onto Property.role"""
+
+    migrate_from = [('properties', '0016_variable_choices_gin_index')]
+    migrate_to = [('properties', '0017_property_role')]
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(executor.loader.graph.leaf_nodes())
+        super().tearDown()
+
+    def test_flags_map_to_roles(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        old_apps = executor.loader.project_state(self.migrate_from).apps
+        OldUser = old_apps.get_model('accounts', 'User')
+        OldProperty = old_apps.get_model('properties', 'Property')
+        user = OldUser.objects.create(email='flags@example.com', password='!')
+        flags = {
+            'subject': (True, False),
+            'both': (True, True),
+            'comparable': (False, True),
+            'neither': (False, False),
+        }
+        ids = {
+            name: OldProperty.objects.create(
+                user=user, name=name, street_address='Rua 1', city='Rio',
+                state='RJ', is_subject=is_subject, is_observed=is_observed,
+            ).pk
+            for name, (is_subject, is_observed) in flags.items()
+        }
+
+        executor = MigrationExecutor(connection)
+        executor.loader.build_graph()
+        executor.migrate(self.migrate_to)
+        new_apps = executor.loader.project_state(self.migrate_to).apps
+        NewProperty = new_apps.get_model('properties', 'Property')
+        roles = dict(NewProperty.objects.values_list('pk', 'role'))
+        self.assertEqual(roles[ids['subject']], 'subject')
+        self.assertEqual(roles[ids['both']], 'subject')
+        self.assertEqual(roles[ids['comparable']], 'comparable')
+        self.assertEqual(roles[ids['neither']], 'other')
@@ -1,3 +1,5 @@
+from decouple import config
+
 from .settings import *
 
 # Development-specific settings
@@ -9,13 +11,31 @@ CORS_ALLOW_ALL_ORIGINS = True
 # Email backend for development (prints to console)
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 
-# Cache backend for development (dummy cache)
+# Cache backend for development (in-process, so cached views and lookups
+# behave as in production)
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.dummy.DummyCache',
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
     }
 }
 
-# Development-specific logging
-LOGGING['handlers']['file']['level'] = 'DEBUG'
-LOGGING['loggers']['property_valuation']['level'] = 'DEBUG'
\ No newline at end of file
+# Development-specific logging; DEBUG file output is written from a
+# background thread so requests do not wait on disk I/O
+LOGGING['handlers']['file'].update({
+    'class': 'core.log_handlers.QueuedFileHandler',
+    'level': 'DEBUG',
+})
+LOGGING['loggers']['property_valuation']['level'] = 'DEBUG'
+
+# SQL statement logging (opt-in): LOG_SQL=True python manage.py runserver
+if config('LOG_SQL', default=False, cast=bool):
+    LOGGING['handlers']['sql_console'] = {
+        'level': 'DEBUG',
+        'class': 'logging.StreamHandler',
+        'formatter': 'simple',
+    }
+    LOGGING['loggers']['django.db.backends'] = {
+        'handlers': ['sql_console'],
+        'level': 'DEBUG',
+        'propagate': False,
+    }
\ No newline at end of file